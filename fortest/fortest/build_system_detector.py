@@ -2,8 +2,10 @@
 Module for detecting build systems in Fortran projects.
 """
 
+import os
 from pathlib import Path
 from dataclasses import dataclass
+from typing import ClassVar
 
 
 @dataclass(frozen=True)
@@ -30,6 +32,20 @@ class BuildSystemDetector:
     starting from the test file directory and moving upwards.
     Priority order: FPM > CMake > Make
     """
+    # Build system configuration files and their types, in priority order
+    BUILD_FILES: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("fpm.toml", "fpm"),
+        ("CMakeLists.txt", "cmake"),
+        ("Makefile", "make"),
+    )
+
+    # Display names of the build system types
+    BUILD_SYSTEM_NAMES: ClassVar[dict[str, str]] = {
+        "fpm": "FPM",
+        "cmake": "CMake",
+        "make": "Make",
+    }
+
     def __init__(self, verbose: bool = False) -> None:
         """
         Initialize the build system detector.
@@ -40,6 +56,10 @@ class BuildSystemDetector:
             Enable verbose output, by default False
         """
         self._verbose: bool = verbose
+        # Entry names keyed by directory, validated by the directory's mtime_ns
+        self._dir_names_cache: dict[Path, tuple[int, frozenset[str]]] = {}
+        # Detection results keyed by the resolved directory of a test file
+        self._detect_cache: dict[Path, BuildSystemInfo | None] = {}
 
 
     def detect(self, test_file: Path) -> BuildSystemInfo | None:
@@ -60,34 +80,109 @@ class BuildSystemDetector:
             Build system information if detected, None otherwise
         """
         # Start from test file directory and search upwards
-        current: Path = test_file.resolve().parent
+        start: Path = test_file.resolve().parent
+
+        # Every test file in the same directory belongs to the same project
+        if start in self._detect_cache:
+            build_info: BuildSystemInfo | None = self._detect_cache[start]
+        else:
+            build_info = self._find_build_system(start)
+            self._detect_cache[start] = build_info
+
+        if self._verbose:
+            if build_info is not None:
+                print(
+                    f"Detected {self.BUILD_SYSTEM_NAMES[build_info.build_type]} "
+                    f"build system in {build_info.project_dir}"
+                )
+            else:
+                print("No build system detected")
+        return build_info
+
+
+    def _find_build_system(self, start: Path) -> BuildSystemInfo | None:
+        """
+        Search a directory and its ancestors for a build system configuration.
+
+        Parameters
+        ----------
+        start : Path
+            Resolved directory to start from
+
+        Returns
+        -------
+        BuildSystemInfo | None
+            Build system information if found, None otherwise
+        """
+        current: Path = start
 
         while current != current.parent:  # Stop at filesystem root
-            # Check for fpm.toml (highest priority)
-            if (current / "fpm.toml").exists():
-                if self._verbose:
-                    print(f"Detected FPM build system in {current}")
-                return BuildSystemInfo("fpm", current)
-
-            # Check for CMakeLists.txt
-            if (current / "CMakeLists.txt").exists():
-                if self._verbose:
-                    print(f"Detected CMake build system in {current}")
-                return BuildSystemInfo("cmake", current)
-
-            # Check for Makefile
-            if (current / "Makefile").exists():
-                if self._verbose:
-                    print(f"Detected Make build system in {current}")
-                return BuildSystemInfo("make", current)
+            # One listing answers all three checks
+            names: frozenset[str] = self._list_dir_names(current)
+
+            # fpm.toml has the highest priority, then CMakeLists.txt, then Makefile
+            for file_name, build_type in self.BUILD_FILES:
+                if file_name in names:
+                    return BuildSystemInfo(build_type, current)
 
             current = current.parent
 
-        if self._verbose:
-            print("No build system detected")
         return None
 
 
+    def _list_dir_names(self, directory: Path) -> frozenset[str]:
+        """
+        Return the entry names of a directory, reusing a cached listing.
+
+        The listing is reused while the directory's mtime is unchanged, so
+        every test under the same tree pays one stat per ancestor instead of
+        one per probed file name.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory to list
+
+        Returns
+        -------
+        frozenset[str]
+            Names of the entries in the directory (empty if it cannot be read)
+        """
+        try:
+            mtime_ns: int = os.stat(directory).st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        cached: tuple[int, frozenset[str]] | None = self._dir_names_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        names: frozenset[str] = self._read_dir_names(directory)
+        self._dir_names_cache[directory] = (mtime_ns, names)
+        return names
+
+
+    def _read_dir_names(self, directory: Path) -> frozenset[str]:
+        """
+        List the entry names of a directory with a single scandir.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory to list
+
+        Returns
+        -------
+        frozenset[str]
+            Names of the entries in the directory (empty if it cannot be read)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name for entry in entries)
+        except OSError:
+            return frozenset()
+
+
     def find_cmake_executable(self, build_dir: Path, test_file: Path) -> Path | None:
         """
         Find test executable in CMake build directory.
@@ -112,10 +207,11 @@ class BuildSystemDetector:
             "test_sample_module",
         ]
 
+        # One listing answers every candidate name
+        names: frozenset[str] = self._read_dir_names(build_dir)
         for name in possible_names:
-            executable: Path = build_dir / name
-            if executable.exists():
-                return executable
+            if name in names:
+                return build_dir / name
 
         if self._verbose:
             print(f"Warning: Could not find test executable in {build_dir}")
@@ -141,8 +237,18 @@ class BuildSystemDetector:
         build_dir: Path = project_dir / "build"
         test_stem: str = test_file.stem
 
-        for test_dir in build_dir.glob("gfortran_*/test"):
-            executable: Path = test_dir / test_stem
+        # List build/ once and probe only the gfortran_* profile directories
+        try:
+            with os.scandir(build_dir) as entries:
+                profile_dirs: list[str] = [
+                    entry.path for entry in entries
+                    if entry.name.startswith("gfortran_") and entry.is_dir()
+                ]
+        except OSError:
+            profile_dirs = []
+
+        for profile_dir in profile_dirs:
+            executable: Path = Path(profile_dir, "test", test_stem)
             if executable.exists():
                 return executable
 
@@ -168,15 +274,20 @@ class BuildSystemDetector:
             Path to the test executable if found, None otherwise
         """
         test_stem: str = test_file.stem
-        possible_paths: list[Path] = [
-            project_dir / test_stem,
-            project_dir / "build" / test_stem,
-            project_dir / f"test_{test_stem.replace('test_', '')}",
+        possible_paths: list[tuple[Path, str]] = [
+            (project_dir, test_stem),
+            (project_dir / "build", test_stem),
+            (project_dir, f"test_{test_stem.replace('test_', '')}"),
         ]
 
-        for executable in possible_paths:
-            if executable.exists():
-                return executable
+        # List each candidate directory at most once
+        listings: dict[Path, frozenset[str]] = {}
+        for parent, name in possible_paths:
+            names: frozenset[str] | None = listings.get(parent)
+            if names is None:
+                names = listings[parent] = self._read_dir_names(parent)
+            if name in names:
+                return parent / name
 
         if self._verbose:
             print("Warning: Could not find test executable")
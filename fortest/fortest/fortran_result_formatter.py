@@ -2,11 +2,19 @@
 Module for formatting and displaying test results.
 """
 
+import io
 import re
-from fortest.test_result import Colors, MessageTag, TestResult
+from fortest.test_result import FAIL_PREFIX, PASS_PREFIX, Colors, MessageTag, TestResult
 from fortest.exit_status import ExitStatus
 
 
+# Matches an ANSI color escape sequence
+_ANSI_ESCAPE_PATTERN: re.Pattern[str] = re.compile(r"\x1b\[[0-9;]*m")
+
+# Characters of the count that ends a Fortran summary line like "[PASS]   9"
+_DIGITS: str = "0123456789"
+
+
 class FortranResultFormatter:
     """
     Formats and displays test results.
@@ -41,22 +49,35 @@ class FortranResultFormatter:
             List of parsed test results
         """
         results: list[TestResult] = []
-        lines: list[str] = output.strip().split("\n")
-
-        for line in lines:
-            # Remove ANSI color codes first
-            clean: str = re.sub(r"\x1b\[[0-9;]*m", "", line).rstrip()
 
-            # Skip Fortran summary lines like "[PASS]   9" or "[FAIL]   0"
-            if re.search(rf"{re.escape(MessageTag.PASS.value)}\s*\d+\s*$", clean) \
-            or re.search(rf"{re.escape(MessageTag.FAIL.value)}\s*\d+\s*$", clean):
+        pass_tag: str = MessageTag.PASS
+        fail_tag: str = MessageTag.FAIL
+        # Lines are read one at a time instead of splitting the output into a list
+        for line in io.StringIO(output):
+            # Lines without a tag carry no result and skip the regex work
+            if pass_tag not in line and fail_tag not in line:
                 continue
 
-            if MessageTag.PASS.value in clean:
-                test_name: str = clean.split(MessageTag.PASS.value, 1)[1].strip()
+            # Remove ANSI color codes first, if the line has any
+            clean: str = (_ANSI_ESCAPE_PATTERN.sub("", line) if "\x1b" in line else line).rstrip()
+
+            # Skip Fortran summary lines like "[PASS]   9" or "[FAIL]   0":
+            # a tag followed only by a count
+            head: str = clean.rstrip(_DIGITS)
+            if len(head) < len(clean):
+                head = head.rstrip()
+                if head.endswith(pass_tag) or head.endswith(fail_tag):
+                    continue
+
+            index: int = clean.find(pass_tag)
+            if index >= 0:
+                test_name: str = clean[index + len(pass_tag):].strip()
                 results.append(TestResult(test_name, True))
-            elif MessageTag.FAIL.value in clean:
-                test_name: str = clean.split(MessageTag.FAIL.value, 1)[1].strip()
+                continue
+
+            index = clean.find(fail_tag)
+            if index >= 0:
+                test_name = clean[index + len(fail_tag):].strip()
                 results.append(TestResult(test_name, False))
 
         return results
@@ -131,15 +152,9 @@ class FortranResultFormatter:
         # Print individual results
         for result in normal_results:
             if result.passed:
-                print(
-                    f"{Colors.GREEN.value}{MessageTag.PASS.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{PASS_PREFIX}{result.name}")
             else:
-                print(
-                    f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{FAIL_PREFIX}{result.name}")
             if result.message:
                 print(f"       {result.message}")
 
@@ -150,8 +165,8 @@ class FortranResultFormatter:
         print()
         print(separator)
         print(f"Normal tests: {len(normal_results)}")
-        print(f"{Colors.GREEN.value}{MessageTag.PASS.value}{normal_passed:>4}{Colors.RESET.value}")
-        print(f"{Colors.RED.value}{MessageTag.FAIL.value}{normal_failed:>4}{Colors.RESET.value}")
+        print(f"{Colors.GREEN}{MessageTag.PASS}{normal_passed:>4}{Colors.RESET}")
+        print(f"{Colors.RED}{MessageTag.FAIL}{normal_failed:>4}{Colors.RESET}")
         print(separator)
         print()
 
@@ -172,15 +187,9 @@ class FortranResultFormatter:
         # Print individual results
         for result in error_stop_results:
             if result.passed:
-                print(
-                    f"{Colors.GREEN.value}{MessageTag.PASS.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{PASS_PREFIX}{result.name}")
             else:
-                print(
-                    f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{FAIL_PREFIX}{result.name}")
                 if result.message:
                     print(f"       {result.message}")
 
@@ -188,8 +197,8 @@ class FortranResultFormatter:
         print()
         print(separator)
         print(f"error_stop tests: {len(error_stop_results)}")
-        print(f"{Colors.GREEN.value}{MessageTag.PASS.value}{error_stop_passed:>4}{Colors.RESET.value}")
-        print(f"{Colors.RED.value}{MessageTag.FAIL.value}{error_stop_failed:>4}{Colors.RESET.value}")
+        print(f"{Colors.GREEN}{MessageTag.PASS}{error_stop_passed:>4}{Colors.RESET}")
+        print(f"{Colors.RED}{MessageTag.FAIL}{error_stop_failed:>4}{Colors.RESET}")
         print(separator)
         print()
 
@@ -224,13 +233,13 @@ class FortranResultFormatter:
         print("All tests completed.")
         print(separator_table)
         print(f"Total tests: {total_tests}")
-        print(f"{Colors.GREEN.value}{MessageTag.PASS.value}{passed_tests:>4}{Colors.RESET.value}")
-        print(f"{Colors.RED.value}{MessageTag.FAIL.value}{failed_tests:>4}{Colors.RESET.value}")
+        print(f"{Colors.GREEN}{MessageTag.PASS}{passed_tests:>4}{Colors.RESET}")
+        print(f"{Colors.RED}{MessageTag.FAIL}{failed_tests:>4}{Colors.RESET}")
         print(separator_table)
 
         if failed_tests == 0 and total_tests > 0:
-            print(f"\n{Colors.GREEN.value}{Colors.BOLD.value}All tests passed! ✓{Colors.RESET.value}")
+            print(f"\n{Colors.GREEN}{Colors.BOLD}All tests passed! ✓{Colors.RESET}")
             return ExitStatus.SUCCESS.value
         else:
-            print(f"\n{Colors.RED.value}{Colors.BOLD.value}Some tests failed ✗{Colors.RESET.value}")
+            print(f"\n{Colors.RED}{Colors.BOLD}Some tests failed ✗{Colors.RESET}")
             return ExitStatus.ERROR.value
\ No newline at end of file
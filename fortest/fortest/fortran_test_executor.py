@@ -4,7 +4,9 @@ Test execution logic for Fortran tests.
 
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 from fortest.test_result import TestResult
 from fortest.build_system_detector import BuildSystemDetector, BuildSystemInfo
@@ -12,6 +14,7 @@ from fortest.module_dependency_resolver import ModuleDependencyResolver
 from fortest.fortran_test_generator import FortranTestGenerator
 from fortest.fortran_result_formatter import FortranResultFormatter
 from fortest.project_builder import ProjectBuilder
+from fortest.utilities import get_thread_output, set_thread_output
 
 
 class FortranTestExecutor:
@@ -31,6 +34,7 @@ class FortranTestExecutor:
         generator: FortranTestGenerator,
         formatter: FortranResultFormatter,
         builder: ProjectBuilder,
+        jobs: int = 1,
     ) -> None:
         """
         Initialize TestExecutor.
@@ -51,6 +55,8 @@ class FortranTestExecutor:
             Test result formatter instance
         builder : ProjectBuilder
             Project builder instance
+        jobs : int, optional
+            Maximum number of tests of a file to compile and run at once, by default 1
         """
         self._compiler = compiler
         self._verbose = verbose
@@ -59,6 +65,7 @@ class FortranTestExecutor:
         self._generator = generator
         self._formatter = formatter
         self._builder = builder
+        self._jobs = jobs
 
 
     def is_standalone_program(self, test_file: Path) -> bool:
@@ -75,20 +82,20 @@ class FortranTestExecutor:
         bool
             True if standalone program or error_stop test
         """
-        content = test_file.read_text().lower()
-        
-        # Check if it contains 'program' statement
-        if "program " in content:
-            return True
-        
-        # Check if filename contains 'error_stop'
+        # Check if filename contains 'error_stop' (no file read needed)
         if "error_stop" in test_file.name.lower():
             return True
         
-        return False
+        # Check if it contains 'program' statement (outside comments)
+        kind, _ = self._resolver.classify_test_file(test_file)
+        return kind == "program"
 
 
-    def run_test_executable(self, executable: Path) -> tuple[bool, str, int]:
+    def run_test_executable(
+        self,
+        executable: Path,
+        args: list[str] | None = None,
+    ) -> tuple[bool, str, int]:
         """
         Run test executable and capture output.
         
@@ -96,6 +103,8 @@ class FortranTestExecutor:
         ----------
         executable : Path
             Path to executable
+        args : list[str] | None, optional
+            Command line arguments for the executable, by default None
         
         Returns
         -------
@@ -106,12 +115,13 @@ class FortranTestExecutor:
             print(f"Running: {executable}")
         
         try:
-            result = subprocess.run(
-                [str(executable)],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            with self._builder.process_slot():
+                result = subprocess.run(
+                    [str(executable), *(args or [])],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
             
             output = result.stdout + result.stderr
             success = result.returncode == 0
@@ -232,22 +242,20 @@ class FortranTestExecutor:
                 print(f"No error_stop tests found in {test_file}")
             return []
         
-        results = []
         module_name = test_file.stem
         
-        for test_name in error_stop_test_names:
+        def run_error_stop_test(test_name: str) -> TestResult:
             if self._verbose:
                 print(f"\nRunning error_stop test: {test_name}")
             
-            result = self._run_single_error_stop_test(
+            return self._run_single_error_stop_test(
                 test_file,
                 module_name,
                 test_name,
                 output_dir,
             )
-            results.append(result)
         
-        return results
+        return self._map_tests(run_error_stop_test, error_stop_test_names)
 
 
     def _run_single_error_stop_test(
@@ -276,14 +284,50 @@ class FortranTestExecutor:
         TestResult
             Test result
         """
-        # Generate test program
-        program_file = self._generator.generate_error_stop_test_program(
-            module_name,
-            test_name,
-            output_dir,
+        return self._run_single_test(test_file, module_name, test_name, output_dir, error_stop=True)
+
+
+    def _run_single_test(
+        self,
+        test_file: Path,
+        module_name: str,
+        test_name: str,
+        output_dir: Path,
+        error_stop: bool,
+    ) -> TestResult:
+        """
+        Build a program for a single test, run it and check the outcome.
+        
+        Normal and error_stop tests share the build; they differ in the
+        generated program and in how the run is judged.
+        
+        Parameters
+        ----------
+        test_file : Path
+            Path to test file
+        module_name : str
+            Name of test module
+        test_name : str
+            Name of test subroutine
+        output_dir : Path
+            Directory for build artifacts
+        error_stop : bool
+            Whether the test is expected to trigger error stop
+        
+        Returns
+        -------
+        TestResult
+            Test result
+        """
+        # Generate test program that calls the single test
+        generate_program = (
+            self._generator.generate_error_stop_test_program
+            if error_stop
+            else self._generator.generate_single_test_program
         )
+        program_file = generate_program(module_name, test_name, output_dir)
         
-        # Compile
+        # Compile the test
         executable, error = self._builder.compile_test(
             test_file,
             output_dir,
@@ -298,7 +342,9 @@ class FortranTestExecutor:
             )
         
         # Execute and check
-        return self._execute_and_check_error_stop(test_name, executable)
+        if error_stop:
+            return self._execute_and_check_error_stop(test_name, executable)
+        return self._execute_and_check_normal_test(test_name, executable)
 
 
     def _compile_and_run_normal_tests(
@@ -330,21 +376,72 @@ class FortranTestExecutor:
         if not test_subroutines:
             return []
         
-        results = []
+        # One program dispatches to every test by name, so it is linked once
+        program_file = self._generator.generate_dispatching_test_program(
+            module_name,
+            test_subroutines,
+            output_dir,
+        )
+        executable, error = self._builder.compile_test(
+            test_file,
+            output_dir,
+            program_file=program_file,
+        )
         
-        for test_name in test_subroutines:
+        def run_normal_test(test_name: str) -> TestResult:
             if self._verbose:
                 print(f"\nRunning test: {test_name}")
             
-            result = self._run_single_normal_test(
-                test_file,
-                module_name,
-                test_name,
-                output_dir,
-            )
-            results.append(result)
+            # Without the shared executable, each test is built on its own so
+            # that one test that does not compile does not fail the others
+            if error:
+                return self._run_single_normal_test(
+                    test_file,
+                    module_name,
+                    test_name,
+                    output_dir,
+                )
+            return self._execute_and_check_normal_test(test_name, executable, [test_name])
+        
+        return self._map_tests(run_normal_test, test_subroutines)
+
+
+    def _map_tests(
+        self,
+        run_test: Callable[[str], TestResult],
+        test_names: list[str],
+    ) -> list[TestResult]:
+        """
+        Run tests by name, in parallel when more than one job is allowed.
+        
+        Compilation and execution happen in subprocesses, so threads suffice.
+        The pool may run inside a pool over test files; the builder's process
+        slots keep the processes of all pools together within jobs.
+        Worker threads write to the output buffer of the calling thread.
+        Verbose runs stay serial so that the trace of each test stays together.
         
-        return results
+        Parameters
+        ----------
+        run_test : Callable[[str], TestResult]
+            Function running a single test
+        test_names : list[str]
+            Names of the tests to run
+        
+        Returns
+        -------
+        list[TestResult]
+            Test results in the order of test_names
+        """
+        workers: int = min(self._jobs, len(test_names))
+        if workers <= 1 or self._verbose:
+            return [run_test(test_name) for test_name in test_names]
+        
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            initializer=set_thread_output,
+            initargs=(get_thread_output(),),
+        ) as pool:
+            return list(pool.map(run_test, test_names))
 
 
     def _run_single_normal_test(
@@ -373,29 +470,34 @@ class FortranTestExecutor:
         TestResult
             Test result
         """
-        # Generate test program that calls the single test
-        program_file = self._generator.generate_single_test_program(
-            module_name,
-            test_name,
-            output_dir,
-        )
-        
-        # Compile the test
-        executable, error = self._builder.compile_test(
-            test_file,
-            output_dir,
-            program_file=program_file,
-        )
+        return self._run_single_test(test_file, module_name, test_name, output_dir, error_stop=False)
+
+
+    def _execute_and_check_normal_test(
+        self,
+        test_name: str,
+        executable: Path,
+        args: list[str] | None = None,
+    ) -> TestResult:
+        """
+        Execute a normal test and turn its output into a result.
         
-        if error:
-            return TestResult(
-                name=test_name,
-                passed=False,
-                message=f"Compilation failed:\n{error}",
-            )
+        Parameters
+        ----------
+        test_name : str
+            Name of the test
+        executable : Path
+            Path to test executable
+        args : list[str] | None, optional
+            Command line arguments for the executable, by default None
         
+        Returns
+        -------
+        TestResult
+            Test result
+        """
         # Run the test
-        success, output, exit_code = self.run_test_executable(executable)
+        success, output, exit_code = self.run_test_executable(executable, args)
         
         # Parse output
         parsed_results = self._formatter.parse_test_output(output)
@@ -2,10 +2,12 @@
 Module for generating test programs for Fortran tests.
 """
 
-import re
+import os
 from pathlib import Path
 from typing import ClassVar
 
+from fortest.module_dependency_resolver import ModuleDependencyResolver
+
 
 class FortranTestGenerator:
     """
@@ -16,8 +18,13 @@ class FortranTestGenerator:
     """
     # Module name of fortest assertion
     ASSERTION_MODULE: ClassVar[str] = "fortest_assertions"
+    # Use statement of the assertion module, shared by the generated programs
+    USE_ASSERTIONS_LINE: ClassVar[str] = f"    use {ASSERTION_MODULE}\n"
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(self,
+        verbose: bool = False,
+        resolver: ModuleDependencyResolver | None = None,
+    ) -> None:
         """
         Initialize the test code generator.
 
@@ -25,8 +32,12 @@ class FortranTestGenerator:
         ----------
         verbose : bool, optional
             Enable verbose output, by default False
+        resolver : ModuleDependencyResolver | None, optional
+            Module dependency resolver whose parsed-file cache is shared,
+            by default None (creates new one)
         """
         self._verbose: bool = verbose
+        self._resolver: ModuleDependencyResolver = resolver or ModuleDependencyResolver(verbose)
 
 
     def extract_test_subroutines(self, test_file: Path) -> list[str]:
@@ -45,24 +56,9 @@ class FortranTestGenerator:
         list[str]
             List of test subroutine names in lowercase (unique, order-preserving)
         """
-        with open(test_file, "r") as f:
-            content: str = f.read()
-
-        # Remove comments
-        content = re.sub(r"!.*$", "", content, flags=re.MULTILINE)
-
-        # Match only lines that start a subroutine (avoid "end subroutine ...")
-        pattern: str = r"(?mi)^\s*subroutine\s+(test_\w+)\b"
-        matches: list[str] = re.findall(pattern, content)
-
-        # Normalize to lowercase and remove duplicates preserving order
-        seen: set[str] = set()
-        test_subroutines: list[str] = []
-        for m in matches:
-            name: str = m.lower()
-            if name not in seen:
-                seen.add(name)
-                test_subroutines.append(name)
+        test_subroutines: list[str] = list(
+            self._resolver.parse_fortran_file(test_file).test_subroutines
+        )
 
         if self._verbose:
             print(f"Found test subroutines: {test_subroutines}")
@@ -125,21 +121,23 @@ class FortranTestGenerator:
         Path
             Path to the generated program file
         """
-        program_content: str = f"program run_{test_file.stem}\n"
-        program_content += f"    use {self.ASSERTION_MODULE}\n"
-        program_content += f"    use {test_module_name}\n"
-        program_content += "    implicit none\n"
+        stem: str = test_file.stem
+        parts: list[str] = [
+            f"program run_{stem}\n",
+            self.USE_ASSERTIONS_LINE,
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+        ]
 
         # Call all test subroutines
-        for test_sub in test_subroutines:
-            program_content += f"    call {test_sub}()\n"
+        parts.extend(f"    call {test_sub}()\n" for test_sub in test_subroutines)
 
-        program_content += "    call print_summary()\n"
-        program_content += f"end program run_{test_file.stem}\n"
+        parts.append("    call print_summary()\n")
+        parts.append(f"end program run_{stem}\n")
+        program_content: str = "".join(parts)
 
         generated_file: Path = output_dir / f"gen_runner_{test_file.name}"
-        with open(generated_file, "w") as f:
-            f.write(program_content)
+        self.write_program(generated_file, program_content)
 
         if self._verbose:
             print(f"Generated program:\n{program_content}")
@@ -170,15 +168,16 @@ class FortranTestGenerator:
         Path
             Path to the generated program file
         """
-        program_content: str = f"program run_{test_subroutine}\n"
-        program_content += f"    use {test_module_name}\n"
-        program_content += "    implicit none\n"
-        program_content += f"    call {test_subroutine}()\n"
-        program_content += f"end program run_{test_subroutine}\n"
+        program_content: str = "".join([
+            f"program run_{test_subroutine}\n",
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            f"    call {test_subroutine}()\n",
+            f"end program run_{test_subroutine}\n",
+        ])
 
         generated_file: Path = output_dir / f"gen_{test_subroutine}.f90"
-        with open(generated_file, "w") as f:
-            f.write(program_content)
+        self.write_program(generated_file, program_content)
 
         if self._verbose:
             print(f"Generated error_stop test program:\n{program_content}")
@@ -209,18 +208,104 @@ class FortranTestGenerator:
         Path
             Path to the generated program file
         """
-        program_content: str = f"program run_{test_subroutine}\n"
-        program_content += f"    use {self.ASSERTION_MODULE}\n"
-        program_content += f"    use {test_module_name}\n"
-        program_content += "    implicit none\n"
-        program_content += f"    call {test_subroutine}()\n"
-        program_content += f"end program run_{test_subroutine}\n"
+        program_content: str = "".join([
+            f"program run_{test_subroutine}\n",
+            self.USE_ASSERTIONS_LINE,
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            f"    call {test_subroutine}()\n",
+            f"end program run_{test_subroutine}\n",
+        ])
 
         generated_file: Path = output_dir / f"gen_{test_subroutine}.f90"
-        with open(generated_file, "w") as f:
-            f.write(program_content)
+        self.write_program(generated_file, program_content)
 
         if self._verbose:
             print(f"Generated program for {test_subroutine}:\n{program_content}")
 
-        return generated_file
\ No newline at end of file
+        return generated_file
+
+
+    def generate_dispatching_test_program(
+        self,
+        test_module_name: str,
+        test_subroutines: list[str],
+        output_dir: Path,
+    ) -> Path:
+        """
+        Generate a program that runs the test named by its first argument.
+
+        One executable then serves every normal test of a module, each test
+        still running in its own process.
+
+        Parameters
+        ----------
+        test_module_name : str
+            Name of the test module
+        test_subroutines : list[str]
+            Names of the test subroutines to dispatch to
+        output_dir : Path
+            Directory to write the generated program
+
+        Returns
+        -------
+        Path
+            Path to the generated program file
+        """
+        parts: list[str] = [
+            "program fortest_dispatch\n",
+            self.USE_ASSERTIONS_LINE,
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            "    character(len=63) :: fortest_test_name\n",
+            "    call get_command_argument(1, fortest_test_name)\n",
+            "    select case (trim(fortest_test_name))\n",
+        ]
+        for test_sub in test_subroutines:
+            parts.append(f'    case ("{test_sub}")\n')
+            parts.append(f"        call {test_sub}()\n")
+        parts.append("    case default\n")
+        parts.append('        print "(2a)", "Unknown test: ", trim(fortest_test_name)\n')
+        parts.append("        error stop 1\n")
+        parts.append("    end select\n")
+        parts.append("end program fortest_dispatch\n")
+        program_content: str = "".join(parts)
+
+        generated_file: Path = output_dir / f"gen_dispatch_{test_module_name}.f90"
+        self.write_program(generated_file, program_content)
+
+        if self._verbose:
+            print(f"Generated dispatching program:\n{program_content}")
+
+        return generated_file
+
+
+    def write_program(self, generated_file: Path, program_content: str) -> None:
+        """
+        Write a generated program with a single unbuffered write.
+
+        All programs of a run go to the run's shared output directory, so
+        this is the only per-program file system work. A file that already
+        holds the same content is left untouched to keep its mtime.
+
+        Parameters
+        ----------
+        generated_file : Path
+            Path of the file to (over)write
+        program_content : str
+            Fortran source to write
+        """
+        encoded: bytes = program_content.encode("utf-8")
+        try:
+            if generated_file.read_bytes() == encoded:
+                return
+        except OSError:
+            pass
+
+        data: memoryview = memoryview(encoded)
+        fd: int = os.open(generated_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
@@ -4,14 +4,22 @@ Module providing implements the core functionality of fortest.
 """
 
 from typing import ClassVar
+import fnmatch
 import glob
-import re
+import io
+import os
 import subprocess
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from fortest.utilities import deduplicate
-from fortest.test_result import Colors, MessageTag, TestResult
+from fortest.utilities import (
+    deduplicate,
+    is_existing_dir,
+    route_thread_output,
+    set_thread_output,
+)
+from fortest.test_result import FAIL_PREFIX, PASS_PREFIX, Colors, MessageTag, TestResult
 from fortest.exit_status import ExitStatus
 from fortest.build_system_detector import BuildSystemInfo, BuildSystemDetector
 from fortest.module_dependency_resolver import ModuleDependencyResolver
@@ -37,6 +45,8 @@ class FortranTestRunner:
         Enable verbose output
     build_dir : Path | None
         Build directory for temporary files
+    jobs : int
+        Maximum number of test files, and of tests per file, run at once
     total_tests : int
         Total number of tests executed
     passed_tests : int
@@ -47,13 +57,13 @@ class FortranTestRunner:
         Number of error_stop tests
     """
     # Fortran intrinsic modules
-    INTRINSIC_MODULES: ClassVar[set[str]] = {
+    INTRINSIC_MODULES: ClassVar[frozenset[str]] = frozenset({
         "iso_fortran_env",
         "iso_c_binding",
         "ieee_arithmetic",
         "ieee_exceptions",
         "ieee_features",
-    }
+    })
 
     # Maximum number of ancestor directories to search for project/source folders.
     # Limits how far _build_search_directories climbs upward from a test file (default: 4).
@@ -76,10 +86,13 @@ class FortranTestRunner:
         compiler: str = "gfortran",
         verbose: bool = False,
         build_dir: Path | None = None,
+        cache_dir: Path | None = None,
+        jobs: int = 1,
     ) -> None:
         self.compiler: str = compiler
         self.verbose: bool = verbose
         self.build_dir: Path | None = build_dir
+        self.jobs: int = max(1, jobs)
         self.total_tests: int = 0
         self.passed_tests: int = 0
         self.failed_tests: int = 0
@@ -87,11 +100,11 @@ class FortranTestRunner:
         
         # Initialize helper classes
         self.detector: BuildSystemDetector = BuildSystemDetector(verbose)
-        self.resolver: ModuleDependencyResolver = ModuleDependencyResolver(verbose)
-        self.generator: FortranTestGenerator = FortranTestGenerator(verbose)
+        self.resolver: ModuleDependencyResolver = ModuleDependencyResolver(verbose, cache_dir)
+        self.generator: FortranTestGenerator = FortranTestGenerator(verbose, self.resolver)
         self.formatter: FortranResultFormatter = FortranResultFormatter(verbose)
-        self.builder: ProjectBuilder = ProjectBuilder(compiler, verbose, self.detector, self.resolver, self.generator)
-        self.executor: FortranTestExecutor = FortranTestExecutor(compiler, verbose, self.detector, self.resolver, self.generator, self.formatter, self.builder)
+        self.builder: ProjectBuilder = ProjectBuilder(compiler, verbose, self.detector, self.resolver, self.generator, cache_dir, self.jobs)
+        self.executor: FortranTestExecutor = FortranTestExecutor(compiler, verbose, self.detector, self.resolver, self.generator, self.formatter, self.builder, self.jobs)
 
 
     def find_test_files(self, pattern: str) -> list[Path]:
@@ -115,25 +128,52 @@ class FortranTestRunner:
 
         # If pattern is a directory, search within it
         if p.exists() and p.is_dir():
-            found: list[Path] = []
-            for test_pattern in ["test_*.f90", "module_test_*.f90"]:
-                for file in p.glob(test_pattern):
-                    if file.is_file():
-                        found.append(file.resolve())
+            # One listing serves both prefixes; test_* files come first
+            test_files: list[Path] = []
+            module_test_files: list[Path] = []
+            with os.scandir(p) as entries:
+                for entry in entries:
+                    name: str = entry.name
+                    if not name.endswith(".f90"):
+                        continue
+                    if name.startswith("test_"):
+                        bucket = test_files
+                    elif name.startswith("module_test_"):
+                        bucket = module_test_files
+                    else:
+                        continue
+                    if entry.is_file():
+                        bucket.append(Path(entry.path).resolve())
 
             # Deduplicate while preserving order
+            return deduplicate(test_files + module_test_files)
+
+        found: list[Path] = []
+        if "/" not in pattern and os.sep not in pattern:
+            # A bare file name pattern: a single walk of the current directory
+            # tree covers both "pattern" and "**/pattern" (hidden entries are
+            # skipped, as glob does)
+            for root, dirs, files in os.walk("."):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                for file in fnmatch.filter(files, pattern):
+                    if file.endswith(".f90") and (not file.startswith(".") or pattern.startswith(".")):
+                        found.append(Path(root, file).resolve())
             return deduplicate(found)
 
-        # Otherwise search for pattern and normalize/resolve results
-        found = []
-        for file in glob.glob(pattern, recursive=True):
-            if file.endswith(".f90"):
-                found.append(Path(file).resolve())
-        for file in glob.glob(f"**/{pattern}", recursive=True):
+        # Otherwise search for pattern; both globs report a file under the same
+        # relative name, so names are deduplicated before resolving them
+        matched: list[str] = glob.glob(pattern, recursive=True)
+
+        # "**/pattern" adds nothing for an absolute pattern or one that already
+        # starts with "**", and would walk the whole current tree for it
+        if not (os.path.isabs(pattern) or pattern.startswith("**")):
+            matched.extend(glob.glob(f"**/{pattern}", recursive=True))
+
+        for file in deduplicate(matched):
             if file.endswith(".f90"):
                 found.append(Path(file).resolve())
 
-        # Deduplicate while preserving order
+        # Different names may still resolve to the same file
         return deduplicate(found)
 
 
@@ -154,26 +194,7 @@ class FortranTestRunner:
         list[Path]
             List of build directories found
         """
-        build_dirs: list[Path] = []
-        current: Path = test_file.resolve().parent
-
-        # Search upward for build directories
-        for _ in range(self.SEARCH_DEPTH_MAX):
-            # Check for common build directory names
-            for build_name in ["build", "Build", "BUILD"]:
-                build_dir = current / build_name
-                if build_dir.exists() and build_dir.is_dir():
-                    build_dirs.append(build_dir)
-                    # Also search subdirectories of build/
-                    for subdir in build_dir.rglob("*"):
-                        if subdir.is_dir() and any(subdir.glob("*.mod")):
-                            build_dirs.append(subdir)
-
-            if current == current.parent:
-                break
-            current = current.parent
-
-        return build_dirs
+        return self.resolver.find_build_directories(test_file)
 
 
     def _build_search_directories(self, test_file: Path) -> list[Path]:
@@ -193,38 +214,7 @@ class FortranTestRunner:
         list[Path]
             List of directories to search (deduplicated, order-preserved)
         """
-        search_dirs: list[Path] = []
-        test_file_abs: Path = test_file.resolve()
-
-        # Start from test file's parent and go up
-        current: Path = test_file_abs.parent
-        search_depth_max: int = FortranTestRunner.SEARCH_DEPTH_MAX
-        target_subdirs: list[str] = FortranTestRunner.TARGET_SUBDIRS
-        for _ in range(search_depth_max):
-            # Add common source directories
-            for subdir in target_subdirs:
-                candidate = current / subdir
-                if candidate.exists() and candidate.is_dir():
-                    search_dirs.append(candidate)
-
-            # Also add current directory
-            search_dirs.append(current)
-
-            if current == current.parent:
-                break
-
-            # Move up one level
-            current = current.parent
-
-        # Remove duplicates while preserving order
-        seen_dirs: set[Path] = set()
-        unique_dirs: list[Path] = []
-        for d in search_dirs:
-            if d not in seen_dirs:
-                seen_dirs.add(d)
-                unique_dirs.append(d)
-
-        return unique_dirs
+        return self.resolver.build_search_directories(test_file)
 
 
     def _find_assertion_module(self, search_dirs: list[Path]) -> Path | None:
@@ -274,33 +264,7 @@ class FortranTestRunner:
         list[Path]
             List of found module files
         """
-        modules: list[Path] = []
-        test_file_abs: Path = test_file.resolve()
-        intrinsic_modules = FortranTestRunner.INTRINSIC_MODULES
-
-        for module_name in used_modules:
-            # Skip intrinsic modules and fortest_assertions
-            fortest_assertions: str = FortranTestRunner.ASSERTION_MODULE
-            if module_name in intrinsic_modules or module_name == fortest_assertions:
-                continue
-
-            # Find module file for this dependency
-            module_file = self.find_module_file_by_name(module_name, search_dirs)
-
-            if not module_file:
-                continue
-
-            is_test_file: bool = module_file == test_file_abs
-            is_in_modules: bool = module_file in modules
-
-            if is_test_file or is_in_modules:
-                continue
-
-            modules.append(module_file)
-            if self.verbose:
-                print(f"Found dependency: {module_file} (provides {module_name})")
-
-        return modules
+        return self.resolver.find_user_modules(used_modules, search_dirs, test_file)
 
 
     def find_module_files(self,
@@ -359,36 +323,7 @@ class FortranTestRunner:
         list[str]
             List of module names used in the file (lowercase, unique)
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content: str = f.read()
-        except (UnicodeDecodeError, OSError):
-            # Skip files with encoding issues or read errors
-            if self.verbose:
-                print(f"Warning: Could not read {file_path} (encoding issue)")
-            return []
-
-        # Remove comments
-        content = re.sub(r"!.*$", "", content, flags=re.MULTILINE)
-
-        # Find use statements with flexible whitespace handling:
-        # - use module_name
-        # - use :: module_name
-        # - use, intrinsic :: module_name
-        # - use module_name, only: ...
-        pattern: str = r"^\s*use\s*(?:,\s*intrinsic\s*)?(?:::\s*)?(\w+)"
-        matches: list[str] = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-
-        # Normalize to lowercase and remove duplicates
-        unique_modules: list[str] = []
-        seen: set[str] = set()
-        for m in matches:
-            name = m.lower()
-            if name not in seen:
-                seen.add(name)
-                unique_modules.append(name)
-
-        return unique_modules
+        return self.resolver.extract_use_statements(file_path)
 
 
     def find_fortran_files_recursive(self, directory: Path, max_depth: int = 3) -> list[Path]:
@@ -559,22 +494,7 @@ class FortranTestRunner:
         Path | None
             Path to the test executable if found, None otherwise
         """
-        test_stem: str = test_file.stem
-        possible_names: list[str] = [
-            test_stem,
-            f"test_{test_stem.replace('test_', '')}",
-            # fallback for examples
-            "test_sample_module",
-        ]
-
-        for name in possible_names:
-            executable: Path = build_dir / name
-            if executable.exists():
-                return executable
-
-        if self.verbose:
-            print(f"Warning: Could not find test executable in {build_dir}")
-        return None
+        return self.detector.find_cmake_executable(build_dir, test_file)
 
 
     def _find_fpm_executable(self, project_dir: Path, test_file: Path) -> Path | None:
@@ -593,17 +513,7 @@ class FortranTestRunner:
         Path | None
             Path to the test executable if found, None otherwise
         """
-        build_dir: Path = project_dir / "build"
-        test_stem: str = test_file.stem
-
-        for test_dir in build_dir.glob("gfortran_*/test"):
-            executable: Path = test_dir / test_stem
-            if executable.exists():
-                return executable
-
-        if self.verbose:
-            print(f"Warning: Could not find test executable in {build_dir}")
-        return None
+        return self.detector.find_fpm_executable(project_dir, test_file)
 
 
     def _find_make_executable(self, project_dir: Path, test_file: Path) -> Path | None:
@@ -622,20 +532,7 @@ class FortranTestRunner:
         Path | None
             Path to the test executable if found, None otherwise
         """
-        test_stem: str = test_file.stem
-        possible_paths: list[Path] = [
-            project_dir / test_stem,
-            project_dir / "build" / test_stem,
-            project_dir / f"test_{test_stem.replace('test_', '')}",
-        ]
-
-        for executable in possible_paths:
-            if executable.exists():
-                return executable
-
-        if self.verbose:
-            print(f"Warning: Could not find test executable")
-        return None
+        return self.detector.find_make_executable(project_dir, test_file)
 
 
     def _build_with_cmake(self, project_dir: Path, test_file: Path) -> Path | None:
@@ -661,7 +558,8 @@ class FortranTestRunner:
         subprocess.run(
             ["cmake", ".."],
             cwd=build_dir,
-            capture_output=True,
+            stdout=None if self.verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
@@ -670,7 +568,8 @@ class FortranTestRunner:
         subprocess.run(
             ["make"],
             cwd=build_dir,
-            capture_output=True,
+            stdout=None if self.verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
@@ -697,7 +596,8 @@ class FortranTestRunner:
         subprocess.run(
             ["fpm", "build"],
             cwd=project_dir,
-            capture_output=True,
+            stdout=None if self.verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
@@ -724,7 +624,8 @@ class FortranTestRunner:
         subprocess.run(
             ["make"],
             cwd=project_dir,
-            capture_output=True,
+            stdout=None if self.verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
@@ -765,14 +666,11 @@ class FortranTestRunner:
         bool
             True if the file contains a program statement or is an error_stop test
         """
-        with open(test_file, "r") as f:
-            content: str = f.read()
-        is_program: re.Match[str] | None = re.search(
-            r"\bprogram\s+\w+",
-            content,
-            re.IGNORECASE,
-        )
-        return "error_stop" in test_file.name.lower() or is_program is not None
+        # The file name alone decides error_stop tests; no need to read them
+        if "error_stop" in test_file.name.lower():
+            return True
+        kind, _ = self.resolver.classify_test_file(test_file)
+        return kind == "program"
 
 
     def _compile_standalone_program(self, test_file: Path, output_dir: Path) -> Path | None:
@@ -806,15 +704,16 @@ class FortranTestRunner:
         try:
             subprocess.run(
                 compile_cmd,
-                capture_output=True,
+                stdout=None if self.verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )
             return executable
         except subprocess.CalledProcessError as e:
             print(
-                f"{Colors.RED.value}Compilation failed for {test_file}"
-                f"{Colors.RESET.value}"
+                f"{Colors.RED}Compilation failed for {test_file}"
+                f"{Colors.RESET}"
             )
             print(e.stderr)
             return None
@@ -840,16 +739,16 @@ class FortranTestRunner:
         test_module_name: str | None = self.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return None
 
         test_subroutines: list[str] = self.extract_test_subroutines(test_file)
         if not test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return None
 
@@ -883,15 +782,16 @@ class FortranTestRunner:
         try:
             subprocess.run(
                 compile_cmd,
-                capture_output=True,
+                stdout=None if self.verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )
             return executable
         except subprocess.CalledProcessError as e:
             print(
-                f"{Colors.RED.value}Compilation failed for {test_file}"
-                f"{Colors.RESET.value}"
+                f"{Colors.RED}Compilation failed for {test_file}"
+                f"{Colors.RESET}"
             )
             print(e.stderr)
             return None
@@ -1048,17 +948,11 @@ class FortranTestRunner:
         # Print results for error_stop tests
         for result in results:
             if result.passed:
-                print(
-                    f"{Colors.GREEN.value}{MessageTag.PASS.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{PASS_PREFIX}{result.name}")
                 if result.message:
                     print(f"       {result.message}")
             else:
-                print(
-                    f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} "
-                    f"{result.name}"
-                )
+                print(f"{FAIL_PREFIX}{result.name}")
                 if result.message:
                     print(f"       {result.message}")
 
@@ -1189,14 +1083,15 @@ class FortranTestRunner:
         try:
             subprocess.run(
                 compile_mod_cmd,
-                capture_output=True,
+                stdout=None if self.verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )
             return output_obj
 
         except subprocess.CalledProcessError as e:
-            print(f"{Colors.RED.value}Compilation error:{Colors.RESET.value}")
+            print(f"{Colors.RED}Compilation error:{Colors.RESET}")
             print(f"  Module: {module_file.name}")
             if e.stderr:
                 print(f"  Error details:")
@@ -1260,7 +1155,6 @@ class FortranTestRunner:
         TestResult
             Test result
         """
-        module_files = self.find_module_files(test_file)
         normal_program = self.generate_single_test_program(
             test_module_name,
             test_subroutine,
@@ -1269,6 +1163,48 @@ class FortranTestRunner:
 
         if self.verbose:
             print(f"Generated test program for {test_subroutine}: {normal_program}")
+
+        executable = output_dir / f"{test_subroutine}_normal"
+        error = self._compile_single_test(test_file, normal_program, executable, output_dir)
+
+        if error:
+            return TestResult(test_subroutine, False, error)
+
+        # Run the test and parse results
+        return self._execute_and_parse_normal_test(test_subroutine, executable)
+
+
+    def _compile_single_test(self,
+        test_file: Path,
+        program_file: Path,
+        executable: Path,
+        output_dir: Path,
+    ) -> str | None:
+        """
+        Compile the module dependencies of a test file and link a single-test program.
+
+        Shared by normal and error_stop tests, which differ only in the
+        generated program and in how the run is judged.
+
+        Parameters
+        ----------
+        test_file : Path
+            Path to the test file
+        program_file : Path
+            Path to the generated program file
+        executable : Path
+            Path for the output executable
+        output_dir : Path
+            Directory for objects and module files
+
+        Returns
+        -------
+        str | None
+            Error message if compilation failed, None on success
+        """
+        module_files = self.find_module_files(test_file)
+
+        if self.verbose:
             print(f"Module dependencies: {[m.name for m in module_files]}")
 
         # Compile module dependencies
@@ -1279,24 +1215,17 @@ class FortranTestRunner:
         )
 
         if error:
-            return TestResult(test_subroutine, False, error)
+            return error
 
         # Compile test executable
-        executable = output_dir / f"{test_subroutine}_normal"
-        error = self._compile_test_executable(
+        return self._compile_test_executable(
             test_file,
-            normal_program,
+            program_file,
             executable,
             compiled_objects,
             output_dir,
         )
 
-        if error:
-            return TestResult(test_subroutine, False, error)
-
-        # Run the test and parse results
-        return self._execute_and_parse_normal_test(test_subroutine, executable)
-
 
     def _execute_and_parse_normal_test(self,
         test_subroutine: str,
@@ -1357,7 +1286,7 @@ class FortranTestRunner:
             Test result
         """
         if returncode != 0:
-            print(f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} {test_subroutine}")
+            print(f"{FAIL_PREFIX}{test_subroutine}")
             print(f"       Test caused error stop or abnormal termination (exit code {returncode})")
             return TestResult(
                 test_subroutine,
@@ -1446,16 +1375,16 @@ class FortranTestRunner:
         test_module_name: str | None = self.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
         all_test_subroutines: list[str] = self.extract_test_subroutines(test_file)
         if not all_test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
@@ -1522,16 +1451,16 @@ class FortranTestRunner:
         test_module_name: str | None = self.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
         all_test_subroutines: list[str] = self.extract_test_subroutines(test_file)
         if not all_test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
@@ -1555,7 +1484,7 @@ class FortranTestRunner:
             if self.verbose and result.stdout:
                 print(result.stdout)
         except subprocess.CalledProcessError as e:
-            print(f"{Colors.RED.value}FPM build failed:{Colors.RESET.value}")
+            print(f"{Colors.RED}FPM build failed:{Colors.RESET}")
             if e.stderr:
                 print(e.stderr)
             if e.stdout:
@@ -1625,27 +1554,23 @@ class FortranTestRunner:
         build_dirs: list[Path] = []
         build_dir: Path = project_dir / "build"
         
-        if not build_dir.exists():
+        if not is_existing_dir(build_dir):
             return build_dirs
         
         # Add all FPM build directories
         for gfortran_dir in build_dir.glob("gfortran_*"):
             if gfortran_dir.is_dir():
                 build_dirs.append(gfortran_dir)
-                # Also add subdirectories that contain .mod files
-                for subdir in gfortran_dir.rglob("*"):
-                    if subdir.is_dir() and any(subdir.glob("*.mod")):
-                        build_dirs.append(subdir)
+                # Also add subdirectories that contain .mod files (one scandir per directory)
+                build_dirs.extend(self.resolver.find_module_directories(gfortran_dir))
         
         # Also check dependencies
         deps_dir = build_dir / "dependencies"
-        if deps_dir.exists():
+        if is_existing_dir(deps_dir):
             for dep_build in deps_dir.rglob("build/gfortran_*"):
                 if dep_build.is_dir():
                     build_dirs.append(dep_build)
-                    for subdir in dep_build.rglob("*"):
-                        if subdir.is_dir() and any(subdir.glob("*.mod")):
-                            build_dirs.append(subdir)
+                    build_dirs.extend(self.resolver.find_module_directories(dep_build))
         
         return build_dirs
 
@@ -1728,17 +1653,18 @@ class FortranTestRunner:
         """
         # Generate test driver program (no print_summary to avoid duplicate summaries)
         fortest_assertions: str = FortranTestRunner.ASSERTION_MODULE
-        driver_content = f"program run_{test_subroutine}\n"
-        driver_content += f"    use {fortest_assertions}\n"
-        driver_content += f"    use {test_module_name}\n"
-        driver_content += "    implicit none\n"
-        driver_content += f"    call {test_subroutine}()\n"
-        driver_content += f"end program run_{test_subroutine}\n"
+        driver_content: str = "".join([
+            f"program run_{test_subroutine}\n",
+            f"    use {fortest_assertions}\n",
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            f"    call {test_subroutine}()\n",
+            f"end program run_{test_subroutine}\n",
+        ])
         
         driver_file = output_dir / f"test_driver_{test_subroutine}.f90"
 
-        with open(driver_file, "w") as f:
-            f.write(driver_content)
+        self.generator.write_program(driver_file, driver_content)
 
         # Compile test with FPM build directories in include path
         output_exe = output_dir / f"test_{test_subroutine}"
@@ -1751,7 +1677,7 @@ class FortranTestRunner:
 
         if not success:
             error_msg = f"Compilation failed:\n{compile_output}"
-            print(f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} {test_subroutine}")
+            print(f"{FAIL_PREFIX}{test_subroutine}")
             print(f"       {error_msg}")
             return TestResult(test_subroutine, False, error_msg)
 
@@ -1760,7 +1686,7 @@ class FortranTestRunner:
 
         # Parse the output to check for assertion failures
         # Even if exit_code == 0, the test may have failed assertions
-        has_fail = MessageTag.FAIL.value in output if output else False
+        has_fail = MessageTag.FAIL in output if output else False
 
         # For normal tests, check both exit code and assertion results
         # Print result immediately
@@ -1776,7 +1702,7 @@ class FortranTestRunner:
             
             if not success or exit_code != 0:
                 # Error stop or abnormal termination
-                print(f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} {test_subroutine}")
+                print(f"{FAIL_PREFIX}{test_subroutine}")
                 print(f"       Test caused error stop or abnormal termination (exit code {exit_code})")
                 return TestResult(test_subroutine, False, f"Error stop (exit code {exit_code})")
             else:
@@ -1813,16 +1739,17 @@ class FortranTestRunner:
             Test result
         """
         # Generate test driver program (no print_summary for error_stop tests)
-        driver_content = f"program run_{test_subroutine}\n"
-        driver_content += f"    use {test_module_name}\n"
-        driver_content += "    implicit none\n"
-        driver_content += f"    call {test_subroutine}()\n"
-        driver_content += f"end program run_{test_subroutine}\n"
+        driver_content: str = "".join([
+            f"program run_{test_subroutine}\n",
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            f"    call {test_subroutine}()\n",
+            f"end program run_{test_subroutine}\n",
+        ])
         
         driver_file = output_dir / f"test_driver_{test_subroutine}.f90"
 
-        with open(driver_file, "w") as f:
-            f.write(driver_content)
+        self.generator.write_program(driver_file, driver_content)
 
         # Compile test with FPM build directories in include path
         output_exe = output_dir / f"test_{test_subroutine}"
@@ -1835,7 +1762,7 @@ class FortranTestRunner:
 
         if not success:
             error_msg = f"Compilation failed:\n{compile_output}"
-            print(f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} {test_subroutine}")
+            print(f"{FAIL_PREFIX}{test_subroutine}")
             print(f"       {error_msg}")
             return TestResult(test_subroutine, False, error_msg)
 
@@ -1941,16 +1868,16 @@ class FortranTestRunner:
         test_module_name: str | None = self.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
         all_test_subroutines: list[str] = self.extract_test_subroutines(test_file)
         if not all_test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
@@ -1974,7 +1901,7 @@ class FortranTestRunner:
             if self.verbose and result.stdout:
                 print(result.stdout)
         except subprocess.CalledProcessError as e:
-            print(f"{Colors.RED.value}FPM build failed:{Colors.RESET.value}")
+            print(f"{Colors.RED}FPM build failed:{Colors.RESET}")
             if e.stderr:
                 print(e.stderr)
             if e.stdout:
@@ -2127,16 +2054,17 @@ class FortranTestRunner:
 
         # Generate test program content
         fortest_assertions: str = FortranTestRunner.ASSERTION_MODULE
-        program_content: str = f"program {temp_program_name}\n"
-        program_content += f"    use {fortest_assertions}\n"
-        program_content += f"    use {test_module_name}\n"
-        program_content += "    implicit none\n"
-        program_content += f"    call {test_subroutine}()\n"
-        program_content += f"end program {temp_program_name}\n"
+        program_content: str = "".join([
+            f"program {temp_program_name}\n",
+            f"    use {fortest_assertions}\n",
+            f"    use {test_module_name}\n",
+            "    implicit none\n",
+            f"    call {test_subroutine}()\n",
+            f"end program {temp_program_name}\n",
+        ])
 
         try:
-            with open(temp_test_file, "w") as f:
-                f.write(program_content)
+            self.generator.write_program(temp_test_file, program_content)
 
             if self.verbose:
                 print(f"Created temporary test program: {temp_test_file}")
@@ -2178,7 +2106,7 @@ class FortranTestRunner:
             if not test_executable or not test_executable.exists():
                 error_msg = f"Could not find test executable for {temp_program_name}"
                 if self.verbose:
-                    print(f"{Colors.YELLOW.value}{error_msg}{Colors.RESET.value}")
+                    print(f"{Colors.YELLOW}{error_msg}{Colors.RESET}")
                 return TestResult(
                     test_subroutine,
                     False,
@@ -2227,7 +2155,7 @@ class FortranTestRunner:
             if result.returncode != 0:
                 # Check if it's a compilation error
                 if "Error" in output or "error" in output:
-                    print(f"{Colors.RED.value}Compilation/execution error for {test_subroutine}:{Colors.RESET.value}")
+                    print(f"{Colors.RED}Compilation/execution error for {test_subroutine}:{Colors.RESET}")
                     print(output)
                     return TestResult(
                         test_subroutine,
@@ -2235,7 +2163,7 @@ class FortranTestRunner:
                         f"Compilation/execution failed: {output}",
                     )
                 else:
-                    print(f"{Colors.RED.value}{MessageTag.FAIL.value}{Colors.RESET.value} {test_subroutine}")
+                    print(f"{FAIL_PREFIX}{test_subroutine}")
                     print(f"       Test caused error stop or abnormal termination (exit code {result.returncode})")
                     if output.strip():
                         print(output)
@@ -2303,16 +2231,16 @@ class FortranTestRunner:
         test_module_name: str | None = self.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
         all_test_subroutines: list[str] = self.extract_test_subroutines(test_file)
         if not all_test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return []
 
@@ -2324,7 +2252,7 @@ class FortranTestRunner:
             executable = self.build_with_system(build_system, test_file)
         except subprocess.CalledProcessError as e:
             if self.verbose:
-                print(f"{Colors.YELLOW.value}{build_system.build_type.upper()} build failed, falling back to direct compilation{Colors.RESET.value}")
+                print(f"{Colors.YELLOW}{build_system.build_type.upper()} build failed, falling back to direct compilation{Colors.RESET}")
                 if e.stderr:
                     print(e.stderr)
             # Fall back to direct compilation
@@ -2332,7 +2260,7 @@ class FortranTestRunner:
 
         if not executable or not executable.exists():
             if self.verbose:
-                print(f"{Colors.YELLOW.value}Test executable not found, falling back to direct compilation{Colors.RESET.value}")
+                print(f"{Colors.YELLOW}Test executable not found, falling back to direct compilation{Colors.RESET}")
             # Fall back to direct compilation - call the normal compilation path
             return self._compile_and_run_tests_fallback(test_file, test_module_name, all_test_subroutines, output_dir)
 
@@ -2355,7 +2283,7 @@ class FortranTestRunner:
 
             # Check for errors
             if result.returncode != 0:
-                print(f"{Colors.RED.value}Test execution failed (exit code {result.returncode}){Colors.RESET.value}")
+                print(f"{Colors.RED}Test execution failed (exit code {result.returncode}){Colors.RESET}")
                 if output.strip():
                     print(output)
                 return [
@@ -2380,7 +2308,7 @@ class FortranTestRunner:
 
         except Exception as e:
             error_msg = f"Error running test: {e}"
-            print(f"{Colors.RED.value}{error_msg}{Colors.RESET.value}")
+            print(f"{Colors.RED}{error_msg}{Colors.RESET}")
             return [
                 TestResult(test_name, False, error_msg)
                 for test_name in all_test_subroutines
@@ -2474,32 +2402,14 @@ class FortranTestRunner:
         TestResult
             Test result
         """
-        module_files = self.find_module_files(test_file)
         error_program = self.generate_error_stop_test_program(
             test_module_name,
             test_subroutine,
             output_dir,
         )
 
-        # Compile module dependencies
-        compiled_objects, error = self._compile_module_dependencies(
-            module_files,
-            test_file,
-            output_dir,
-        )
-
-        if error:
-            return TestResult(test_subroutine, False, error)
-
-        # Compile test executable
         executable = output_dir / test_subroutine
-        error = self._compile_test_executable(
-            test_file,
-            error_program,
-            executable,
-            compiled_objects,
-            output_dir,
-        )
+        error = self._compile_single_test(test_file, error_program, executable, output_dir)
 
         if error:
             return TestResult(test_subroutine, False, error)
@@ -2555,44 +2465,165 @@ class FortranTestRunner:
             List of test file paths to execute
         """
         if not test_files:
-            print(f"{Colors.YELLOW.value}No test files found{Colors.RESET.value}")
+            print(f"{Colors.YELLOW}No test files found{Colors.RESET}")
             return
 
-        print(f"{Colors.BOLD.value}Running Fortran tests...{Colors.RESET.value}\n")
+        print(f"{Colors.BOLD}Running Fortran tests...{Colors.RESET}\n")
+
+        # Resolve dependencies of directly compiled tests up front, in parallel.
+        # Verbose runs skip this so the resolver trace stays in test order.
+        if not self.verbose:
+            direct_files: list[Path] = [
+                f for f in test_files if self.detector.detect(f) is None
+            ]
+            if len(direct_files) > 1:
+                self.resolver.resolve_all_dependencies(direct_files)
 
         # Create temporary directory for executables
-        separator: str = "-" * 60
         with tempfile.TemporaryDirectory() as tmpdir:
             output_dir: Path = Path(tmpdir)
 
-            for test_file in test_files:
-                print(separator)
-                print(f"{Colors.BLUE.value}Testing: {test_file}{Colors.RESET.value}")
+            # Verbose runs stay serial: compilers and test programs write their
+            # trace straight to the terminal, past the per-file buffers
+            if self.jobs > 1 and len(test_files) > 1 and not self.verbose:
+                self._run_test_files_parallel(test_files, output_dir)
+            else:
+                for test_file in test_files:
+                    self._print_test_file_header(test_file)
+
+                    # Delegate to TestExecutor
+                    normal_results, error_results = self.executor.handle_test_file(
+                        test_file,
+                        output_dir,
+                    )
+                    self._report_test_file(normal_results, error_results)
+
+        # Persist the module name index for the next run
+        self.resolver.save_module_name_cache()
 
-                # Delegate to TestExecutor
+
+    def _run_test_files_parallel(self, test_files: list[Path], output_dir: Path) -> None:
+        """
+        Run test files concurrently and report them in order.
+
+        Each file builds in its own subdirectory of output_dir, and its output
+        is buffered until the files before it have been reported. Tests and
+        sources of a file run on nested pools; ProjectBuilder.process_slot
+        bounds the child processes of all of them by jobs.
+
+        Parameters
+        ----------
+        test_files : list[Path]
+            List of test file paths to execute
+        output_dir : Path
+            Directory for build artifacts
+        """
+        def run_test_file(
+            index: int,
+            test_file: Path,
+        ) -> tuple[list[TestResult], list[TestResult], str]:
+            file_output_dir: Path = output_dir / str(index)
+            file_output_dir.mkdir()
+            buffer: io.StringIO = io.StringIO()
+            set_thread_output(buffer)
+            try:
                 normal_results, error_results = self.executor.handle_test_file(
                     test_file,
-                    output_dir,
+                    file_output_dir,
                 )
+            finally:
+                set_thread_output(None)
+            return normal_results, error_results, buffer.getvalue()
+
+        workers: int = min(self.jobs, len(test_files))
+        with route_thread_output(), ThreadPoolExecutor(max_workers=workers) as pool:
+            self._compile_shared_modules(test_files, output_dir)
+            futures: list[Future[tuple[list[TestResult], list[TestResult], str]]] = [
+                pool.submit(run_test_file, index, test_file)
+                for index, test_file in enumerate(test_files)
+            ]
+            for test_file, future in zip(test_files, futures):
+                normal_results, error_results, output = future.result()
+                self._print_test_file_header(test_file)
+                print(output, end="")
+                self._report_test_file(normal_results, error_results)
 
-                # Display results
-                if normal_results:
-                    self.formatter.print_normal_test_summary(normal_results)
-                
-                if error_results:
-                    self.formatter.print_error_stop_summary(error_results)
-
-                # Update statistics
-                all_results = normal_results + error_results
-                for result in all_results:
-                    self.total_tests += 1
-                    if result.passed:
-                        self.passed_tests += 1
-                    else:
-                        self.failed_tests += 1
 
-                # Blank line between test files
-                print()
+    def _compile_shared_modules(self, test_files: list[Path], output_dir: Path) -> None:
+        """
+        Compile modules used by several test files before they run concurrently.
+
+        The output of this step is discarded. A module that fails to compile
+        here is compiled again by each test file using it, and the error is
+        reported in that file's section.
+
+        Parameters
+        ----------
+        test_files : list[Path]
+            List of test file paths about to be executed
+        output_dir : Path
+            Directory for build artifacts
+        """
+        module_test_files: list[Path] = [
+            f for f in test_files
+            if self.detector.detect(f) is None and not self.executor.is_standalone_program(f)
+        ]
+        if len(module_test_files) < 2:
+            return
+
+        set_thread_output(io.StringIO())
+        try:
+            self.builder.compile_shared_modules(module_test_files, output_dir)
+        finally:
+            set_thread_output(None)
+
+
+    def _print_test_file_header(self, test_file: Path) -> None:
+        """
+        Print the header that starts the report of a test file.
+
+        Parameters
+        ----------
+        test_file : Path
+            Path to the test file
+        """
+        print("-" * 60)
+        print(f"{Colors.BLUE}Testing: {test_file}{Colors.RESET}")
+
+
+    def _report_test_file(
+        self,
+        normal_results: list[TestResult],
+        error_results: list[TestResult],
+    ) -> None:
+        """
+        Print the results of a test file and add them to the statistics.
+
+        Parameters
+        ----------
+        normal_results : list[TestResult]
+            Results of the normal tests
+        error_results : list[TestResult]
+            Results of the error_stop tests
+        """
+        # Display results
+        if normal_results:
+            self.formatter.print_normal_test_summary(normal_results)
+
+        if error_results:
+            self.formatter.print_error_stop_summary(error_results)
+
+        # Update statistics
+        all_results = normal_results + error_results
+        for result in all_results:
+            self.total_tests += 1
+            if result.passed:
+                self.passed_tests += 1
+            else:
+                self.failed_tests += 1
+
+        # Blank line between test files
+        print()
 
 
     def print_summary(self) -> int:
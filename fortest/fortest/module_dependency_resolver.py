@@ -2,10 +2,66 @@
 Module for resolving Fortran module dependencies.
 """
 
+import hashlib
+import json
+import mmap
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
 
+from fortest.utilities import available_cpu_count, deduplicate, is_existing_dir
+
+
+# Matches a use statement, the start of a test subroutine, or a
+# program/module statement (including its end statement). Every
+# alternative is anchored at the start of a line, so comments and
+# keywords in the middle of a line are never matched and the scanner
+# only tries the alternatives once per line. A unit name must be on the
+# same line as its keyword, so a bare "end module" never takes the next
+# line's keyword as a name. Use statements accept:
+# - use module_name
+# - use :: module_name
+# - use, intrinsic :: module_name
+# - use module_name, only: ...
+_SOURCE_PATTERN: re.Pattern[bytes] = re.compile(
+    rb"^[ \t]*(?:"
+    rb"use\b[ \t]*(?:,[ \t]*(?:non_)?intrinsic[ \t]*)?(?:::[ \t]*)?(?P<use>\w+)"
+    rb"|subroutine[ \t]+(?P<test>test_\w+)\b"
+    rb"|(?P<end>end[ \t]*)?(?P<unit>program|module)[ \t]+(?P<name>\w+))",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class FortranFileInfo:
+    """
+    Facts about a Fortran source file gathered from a single read.
+
+    Attributes
+    ----------
+    module_name : str | None
+        Name of the first module defined in the file
+    program_name : str | None
+        Name of the first program defined in the file
+    used_modules : tuple[str, ...]
+        Module names from 'use' statements (unique, order-preserving)
+    test_subroutines : tuple[str, ...]
+        Names of subroutines starting with "test_" (unique, order-preserving)
+    module_names : tuple[str, ...]
+        Names of all modules defined in the file (unique, order-preserving)
+
+    All names are in lowercase.
+    """
+    module_name: str | None = None
+    program_name: str | None = None
+    used_modules: tuple[str, ...] = ()
+    test_subroutines: tuple[str, ...] = ()
+    module_names: tuple[str, ...] = ()
+
 
 class ModuleDependencyResolver:
     """
@@ -15,13 +71,13 @@ class ModuleDependencyResolver:
     files need to be compiled before the test file.
     """
     # Fortran intrinsic modules
-    INTRINSIC_MODULES: ClassVar[set[str]] = {
+    INTRINSIC_MODULES: ClassVar[frozenset[str]] = frozenset({
         "iso_fortran_env",
         "iso_c_binding",
         "ieee_arithmetic",
         "ieee_exceptions",
         "ieee_features",
-    }
+    })
 
     # Maximum number of ancestor directories to search for project/source folders.
     SEARCH_DEPTH_MAX: int = 4
@@ -38,7 +94,43 @@ class ModuleDependencyResolver:
     # Module name of fortest assertion
     ASSERTION_MODULE: ClassVar[str] = "fortest_assertions"
 
-    def __init__(self, verbose: bool = False) -> None:
+    # File name of the fortest assertion module source
+    ASSERTION_FILE_NAME: ClassVar[str] = "module_fortest_assertions.f90"
+
+    # Words that follow 'module' in separate module procedure statements
+    # ("module procedure", "module function", ...), which define no module
+    MODULE_PROCEDURE_KEYWORDS: ClassVar[frozenset[str]] = frozenset({
+        "procedure",
+        "function",
+        "subroutine",
+        "pure",
+        "impure",
+        "elemental",
+        "recursive",
+        "non_recursive",
+    })
+
+    # Sources at least this large (bytes) are scanned through mmap instead of being read
+    MMAP_SIZE_MIN: ClassVar[int] = 64 * 1024
+
+    # Directories never descended into when scanning for Fortran sources.
+    # Build trees are located by name in find_build_directories instead.
+    SKIP_DIRS: ClassVar[frozenset[str]] = frozenset({
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "target",
+        ".idea",
+        ".vscode",
+        "build",
+        "Build",
+    })
+
+    def __init__(self, verbose: bool = False, cache_dir: Path | None = None) -> None:
         """
         Initialize the module dependency resolver.
 
@@ -46,8 +138,53 @@ class ModuleDependencyResolver:
         ----------
         verbose : bool, optional
             Enable verbose output, by default False
+        cache_dir : Path | None, optional
+            Directory in which the module name index is persisted between runs.
+            If None, the index is kept in memory only, by default None
         """
         self._verbose: bool = verbose
+        # Build directories keyed by the resolved parent directory of a test file
+        self._build_dirs_cache: dict[Path, list[Path]] = {}
+
+        # Search directories keyed by the resolved parent directory of a test file
+        self._search_dirs_cache: dict[Path, list[Path]] = {}
+        # Fortran files keyed by (resolved directory, max_depth)
+        self._dir_scan_cache: dict[tuple[Path, int], tuple[Path, ...]] = {}
+        # Module name -> defining file, keyed by (search directories, max_depth)
+        self._module_index_cache: dict[tuple[tuple[Path, ...], int], dict[str, Path]] = {}
+        # Serializes index builds so concurrent lookups do not walk the same tree twice.
+        # The other caches are only read or assigned one key at a time, which is
+        # safe across threads; at worst two threads compute the same entry.
+        self._module_index_lock: threading.Lock = threading.Lock()
+        # Module dependencies keyed by (resolved test file, include_assertions),
+        # validated by the test file's mtime_ns
+        self._module_files_cache: dict[tuple[Path, bool], tuple[tuple[Path, ...], int]] = {}
+        # Parsed file contents keyed by file path, validated by (mtime_ns, size)
+        self._file_info_cache: dict[str, tuple[FortranFileInfo, int, int]] = {}
+        # Module names keyed by file path, validated by (mtime_ns, size)
+        self._module_name_cache: dict[str, tuple[str | None, int, int]] = {}
+        self._module_name_cache_dirty: bool = False
+        self._module_name_cache_file: Path | None = None
+        if cache_dir is not None:
+            root_hash: str = hashlib.sha1(str(Path.cwd().resolve()).encode()).hexdigest()[:16]
+            self._module_name_cache_file = cache_dir / f"module_index_{root_hash}.json"
+            self._load_module_name_cache()
+
+
+    def clear_caches(self) -> None:
+        """
+        Forget all directory listings and parsed file contents held in memory.
+
+        The next save_module_name_cache call writes an empty module name index.
+        """
+        self._build_dirs_cache.clear()
+        self._search_dirs_cache.clear()
+        self._dir_scan_cache.clear()
+        self._module_index_cache.clear()
+        self._module_files_cache.clear()
+        self._file_info_cache.clear()
+        self._module_name_cache.clear()
+        self._module_name_cache_dirty = True
 
 
     def find_module_files(
@@ -73,12 +210,23 @@ class ModuleDependencyResolver:
         list[Path]
             List of module file paths that the test depends on (includes transitive dependencies)
         """
+        test_file_abs: Path = test_file.resolve()
+
+        # Every test of a file compiles against the same dependencies
+        cache_key: tuple[Path, bool] = (test_file_abs, include_assertions)
+        try:
+            mtime_ns: int = test_file_abs.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        cached: tuple[tuple[Path, ...], int] | None = self._module_files_cache.get(cache_key)
+        if cached is not None and cached[1] == mtime_ns:
+            return list(cached[0])
+
         modules: list[Path] = []
         processed: set[Path] = set()
-        test_file_abs: Path = test_file.resolve()
 
         # Build search directories
-        search_dirs: list[Path] = self._build_search_directories(test_file_abs)
+        search_dirs: list[Path] = self.build_search_directories(test_file_abs)
 
         # Extract module names used in the test file
         used_modules: list[str] = self.extract_use_statements(test_file_abs)
@@ -95,9 +243,46 @@ class ModuleDependencyResolver:
             used_modules, search_dirs, test_file_abs, modules, processed
         )
 
+        self._module_files_cache[cache_key] = (tuple(modules), mtime_ns)
         return modules
 
 
+    def resolve_all_dependencies(
+        self,
+        test_files: list[Path],
+        include_assertions: bool = True,
+    ) -> dict[Path, list[Path]]:
+        """
+        Run find_module_files for many test files concurrently.
+
+        The work is dominated by directory listings and file reads, which
+        release the GIL, so the walks of independent test files overlap.
+        Results also warm the resolver caches for later per-file calls.
+
+        Parameters
+        ----------
+        test_files : list[Path]
+            Paths to the test files
+        include_assertions : bool
+            Whether to include fortest_assertions (only for standalone mode)
+
+        Returns
+        -------
+        dict[Path, list[Path]]
+            Module files for each test file, in the order of test_files
+        """
+        if not test_files:
+            return {}
+
+        max_workers: int = min(len(test_files), available_cpu_count())
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results: list[list[Path]] = list(pool.map(
+                lambda test_file: self.find_module_files(test_file, include_assertions),
+                test_files,
+            ))
+        return dict(zip(test_files, results))
+
+
     def extract_use_statements(self, file_path: Path) -> list[str]:
         """
         Extract module names from 'use' statements in a Fortran file.
@@ -112,41 +297,133 @@ class ModuleDependencyResolver:
         list[str]
             List of module names used in the file (lowercase, unique)
         """
+        return list(self.parse_fortran_file(file_path).used_modules)
+
+
+    def extract_module_name(self, file_path: Path) -> str | None:
+        """
+        Extract module name from a Fortran file.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the Fortran file
+
+        Returns
+        -------
+        str | None
+            Module name in lowercase, or None if not found
+        """
+        # Reuse the cached result while the file is unchanged
+        key: str = os.fspath(file_path)
+        st: os.stat_result | None
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content: str = f.read()
-        except (UnicodeDecodeError, OSError):
-            # Skip files with encoding issues or read errors
+            st = os.stat(file_path)
+        except OSError:
+            self._module_name_cache.pop(key, None)
+            st = None
+
+        if st is not None:
+            cached = self._module_name_cache.get(key)
+            if cached is not None and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+                return cached[0]
+
+        module_name: str | None = self.parse_fortran_file(file_path).module_name
+        if st is not None:
+            self._module_name_cache[key] = (module_name, st.st_mtime_ns, st.st_size)
+            self._module_name_cache_dirty = True
+        return module_name
+
+
+    def save_module_name_cache(self) -> None:
+        """
+        Write the module name index to the cache directory if it has changed.
+
+        The index maps each file path to its first module name and the
+        (mtime_ns, size) it was read at, rather than module names to paths
+        validated by directory mtimes. Several files in a tree may define the
+        same module, and a per-file entry is invalidated exactly when its file
+        changes, so renames and edits need no directory checks. New files are
+        still found by the directory scan of the run; only the parsing of
+        unchanged files is saved.
+
+        Does nothing when no cache directory was given. Write errors are
+        ignored because the cache only speeds up later runs.
+        """
+        cache_file: Path | None = self._module_name_cache_file
+        if cache_file is None or not self._module_name_cache_dirty:
+            return
+
+        data: dict[str, list[str | int | None]] = {
+            path: list(entry) for path, entry in self._module_name_cache.items()
+        }
+        tmp_file: Path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+            self._module_name_cache_dirty = False
+        except OSError as e:
+            tmp_file.unlink(missing_ok=True)
             if self._verbose:
-                print(f"Warning: Could not read {file_path} (encoding issue)")
-            return []
+                print(f"Warning: Could not write module cache {cache_file}: {e}")
 
-        # Remove comments
-        content = re.sub(r"!.*$", "", content, flags=re.MULTILINE)
 
-        # Find use statements with flexible whitespace handling:
-        # - use module_name
-        # - use :: module_name
-        # - use, intrinsic :: module_name
-        # - use module_name, only: ...
-        pattern: str = r"^\s*use\s*(?:,\s*intrinsic\s*)?(?:::\s*)?(\w+)"
-        matches: list[str] = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+    def _load_module_name_cache(self) -> None:
+        """
+        Load the module name index written by a previous run, if any.
 
-        # Normalize to lowercase and remove duplicates
-        unique_modules: list[str] = []
-        seen: set[str] = set()
-        for m in matches:
-            name = m.lower()
-            if name not in seen:
-                seen.add(name)
-                unique_modules.append(name)
+        A missing or malformed cache file is treated as an empty cache.
+        """
+        cache_file: Path | None = self._module_name_cache_file
+        if cache_file is None:
+            return
 
-        return unique_modules
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        for path, entry in data.items():
+            if (
+                isinstance(entry, list)
+                and len(entry) == 3
+                and (entry[0] is None or isinstance(entry[0], str))
+                and isinstance(entry[1], int)
+                and isinstance(entry[2], int)
+            ):
+                self._module_name_cache[path] = (entry[0], entry[1], entry[2])
+
+
+    def classify_test_file(self, test_file: Path) -> tuple[str, str | None]:
+        """
+        Classify a test file as a standalone program or a module from a single read.
 
+        Parameters
+        ----------
+        test_file : Path
+            Path to the test file
 
-    def extract_module_name(self, file_path: Path) -> str | None:
+        Returns
+        -------
+        tuple[str, str | None]
+            ("program", program_name) if the file contains a program statement,
+            otherwise ("module", module_name) where module_name is None if no
+            module statement was found. Names are in lowercase.
         """
-        Extract module name from a Fortran file.
+        info: FortranFileInfo = self.parse_fortran_file(test_file)
+        if info.program_name is not None:
+            return "program", info.program_name
+        return "module", info.module_name
+
+
+    def parse_fortran_file(self, file_path: Path) -> FortranFileInfo:
+        """
+        Parse a Fortran file once and cache what the other extractors need.
+
+        The cached record is reused while the file's mtime and size are unchanged.
 
         Parameters
         ----------
@@ -155,30 +432,84 @@ class ModuleDependencyResolver:
 
         Returns
         -------
-        str | None
-            Module name in lowercase, or None if not found
+        FortranFileInfo
+            Parsed file information (empty if the file cannot be read)
         """
+        key: str = os.fspath(file_path)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content: str = f.read()
-        except (UnicodeDecodeError, OSError):
-            # Skip files with encoding issues or read errors
+            st: os.stat_result = os.stat(file_path)
+            cached = self._file_info_cache.get(key)
+            if cached is not None and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+                return cached[0]
+
+            info: FortranFileInfo
+            if st.st_size >= self.MMAP_SIZE_MIN:
+                # Scan large sources in place without copying them into memory
+                with open(file_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    info = self._parse_fortran_source(mapped)
+            else:
+                info = self._parse_fortran_source(file_path.read_bytes())
+        except (OSError, ValueError):
+            # Skip files with read errors (ValueError: emptied before mapping)
+            self._file_info_cache.pop(key, None)
             if self._verbose:
-                print(f"Warning: Could not read {file_path} (encoding issue)")
-            return None
+                print(f"Warning: Could not read {file_path}")
+            return FortranFileInfo()
+
+        self._file_info_cache[key] = (info, st.st_mtime_ns, st.st_size)
+        return info
 
-        # Remove comments
-        content = re.sub(r"!.*$", "", content, flags=re.MULTILINE)
 
-        # Find module name
-        match: re.Match[str] | None = re.search(
-            r"\bmodule\s+(\w+)",
-            content,
-            re.IGNORECASE,
+    def _parse_fortran_source(self, content: bytes | mmap.mmap) -> FortranFileInfo:
+        """
+        Extract module, program, use and test subroutine names in one pass.
+
+        The pattern only matches statements at the start of a line, so
+        comments need neither stripping nor a separate pass.
+
+        Parameters
+        ----------
+        content : bytes | mmap.mmap
+            Fortran source code
+
+        Returns
+        -------
+        FortranFileInfo
+            Parsed file information
+        """
+        module_name: str | None = None
+        program_name: str | None = None
+        # dicts are used as insertion-ordered sets
+        used_modules: dict[str, None] = {}
+        test_subroutines: dict[str, None] = {}
+        module_names: dict[str, None] = {}
+
+        for match in _SOURCE_PATTERN.finditer(content):
+            group: str | None = match.lastgroup
+            if group == "use":
+                used_modules[match.group("use").decode("ascii").lower()] = None
+            elif group == "test":
+                test_subroutines[match.group("test").decode("ascii").lower()] = None
+            # End statements are matched only to consume their line
+            elif match.group("end") is None:
+                name: str = match.group("name").decode("ascii").lower()
+                if match.group("unit").lower() == b"program":
+                    if program_name is None:
+                        program_name = name
+                else:
+                    if module_name is None:
+                        module_name = name
+                    if name not in self.MODULE_PROCEDURE_KEYWORDS:
+                        module_names[name] = None
+
+        return FortranFileInfo(
+            module_name,
+            program_name,
+            tuple(used_modules),
+            tuple(test_subroutines),
+            tuple(module_names),
         )
-        if match:
-            return match.group(1).lower()
-        return None
 
 
     def find_fortran_files_recursive(self, directory: Path, max_depth: int = 3) -> list[Path]:
@@ -197,23 +528,46 @@ class ModuleDependencyResolver:
         list[Path]
             List of found .f90 files
         """
+        # Source trees do not change during a run, so each walk is done once
+        cache_key: tuple[Path, int] = (directory.resolve(), max_depth)
+        cached: tuple[Path, ...] | None = self._dir_scan_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         files: list[Path] = []
 
-        def scan_dir(current_dir: Path, depth: int) -> None:
-            if depth > max_depth or not current_dir.is_dir():
-                return
+        # Depth-first walk with an explicit stack. Entries of a directory are
+        # pushed in reverse so that files and subdirectories are visited in
+        # listing order, as a recursive walk would.
+        stack: list[tuple[str, int | None]] = [(os.fspath(directory), 0)]
+        while stack:
+            path, depth = stack.pop()
+            if depth is None:
+                # A .f90 file queued in listing order
+                files.append(Path(path))
+                continue
 
+            pending: list[tuple[str, int | None]] = []
             try:
-                for item in current_dir.iterdir():
-                    if item.is_file() and item.suffix == ".f90":
-                        files.append(item)
-                    elif item.is_dir() and not item.name.startswith('.'):
-                        scan_dir(item, depth + 1)
-            except PermissionError:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        name: str = entry.name
+                        if name.endswith(".f90"):
+                            if entry.is_file():
+                                pending.append((entry.path, None))
+                                continue
+                        if name.startswith('.') or name in self.SKIP_DIRS:
+                            # Prune the whole subtree without listing it
+                            continue
+                        if depth < max_depth and entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, depth + 1))
+            except OSError:
                 # Skip directories we can't read
-                pass
+                continue
 
-        scan_dir(directory, 0)
+            stack.extend(reversed(pending))
+
+        self._dir_scan_cache[cache_key] = tuple(files)
         return files
 
 
@@ -236,27 +590,130 @@ class ModuleDependencyResolver:
         Path | None
             Path to the module file, or None if not found
         """
-        for search_dir in search_dirs:
-            # Search recursively in this directory
-            for f90_file in self.find_fortran_files_recursive(search_dir):
-                file_module = self.extract_module_name(f90_file)
-                if file_module == module_name.lower():
-                    return f90_file
+        name: str = module_name.lower()
+        module_file: Path | None = self._lookup_module(name, search_dirs)
+        if module_file is not None:
+            return module_file
 
         # Fallback: search the current working directory tree more broadly
         cwd = Path.cwd()
         if self._verbose:
             print(f"Module {module_name} not found in search_dirs, searching {cwd} recursively as fallback")
-        for f90_file in self.find_fortran_files_recursive(cwd, max_depth=6):
-            file_module = self.extract_module_name(f90_file)
-            if file_module == module_name.lower():
-                if self._verbose:
-                    print(f"Found {module_name} at {f90_file} via fallback search")
-                return f90_file
+        module_file = self._lookup_module(name, [cwd], max_depth=6)
+        if module_file is not None and self._verbose:
+            print(f"Found {module_name} at {module_file} via fallback search")
+
+        return module_file
+
+
+    def _lookup_module(
+        self,
+        module_name: str,
+        search_dirs: list[Path],
+        max_depth: int = 3,
+    ) -> Path | None:
+        """
+        Find the file defining a module, parsing as few files as possible.
+
+        Directories are tried in priority order, so a later directory is only
+        searched once no file in the earlier ones defines the module. Until a
+        directory has been indexed, only its files whose name contains the
+        module name (module_foo.f90, foo.f90, ...) are parsed; the directory
+        is indexed only when that conventional lookup misses. The index
+        prefers the same files, so the result does not depend on which
+        directories have been indexed already.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the module to find (lowercase)
+        search_dirs : list[Path]
+            Directories to search in, in priority order
+        max_depth : int
+            Maximum depth to search in each directory (default: 3)
+
+        Returns
+        -------
+        Path | None
+            Path to the module file, or None if not found
+        """
+        for search_dir in search_dirs:
+            index: dict[str, Path] | None = self._module_index_cache.get(
+                ((search_dir,), max_depth)
+            )
+            if index is None:
+                for f90_file in self.find_fortran_files_recursive(search_dir, max_depth):
+                    if module_name not in f90_file.stem.lower():
+                        continue
+                    if self.extract_module_name(f90_file) == module_name:
+                        return f90_file
+
+                index = self._build_module_index([search_dir], max_depth)
+
+            module_file: Path | None = index.get(module_name)
+            if module_file is not None:
+                return module_file
 
         return None
 
 
+    def _build_module_index(self, search_dirs: list[Path], max_depth: int = 3) -> dict[str, Path]:
+        """
+        Map each module name defined under search_dirs to its defining file.
+
+        Each directory is walked and parsed once; later lookups are
+        dictionary hits. When several files define the same module, the first
+        search directory defining it wins. Within a directory, a file whose
+        name contains the module name is preferred, then the first one in
+        walk order, matching the file name lookup of _lookup_module.
+
+        Parameters
+        ----------
+        search_dirs : list[Path]
+            Directories to index, in priority order
+        max_depth : int
+            Maximum depth to search in each directory (default: 3)
+
+        Returns
+        -------
+        dict[str, Path]
+            Module name (lowercase) to file path
+        """
+        cache_key: tuple[tuple[Path, ...], int] = (tuple(search_dirs), max_depth)
+        index: dict[str, Path] | None = self._module_index_cache.get(cache_key)
+        if index is not None:
+            return index
+
+        if len(search_dirs) != 1:
+            index = {}
+            for search_dir in search_dirs:
+                for name, module_file in self._build_module_index([search_dir], max_depth).items():
+                    index.setdefault(name, module_file)
+            self._module_index_cache[cache_key] = index
+            return index
+
+        with self._module_index_lock:
+            # Another thread may have built it while we waited
+            index = self._module_index_cache.get(cache_key)
+            if index is not None:
+                return index
+
+            index = {}
+            for f90_file in self.find_fortran_files_recursive(search_dirs[0], max_depth):
+                file_module: str | None = self.extract_module_name(f90_file)
+                if file_module is None:
+                    continue
+                indexed: Path | None = index.get(file_module)
+                if indexed is None or (
+                    file_module in f90_file.stem.lower()
+                    and file_module not in indexed.stem.lower()
+                ):
+                    index[file_module] = f90_file
+
+            self._module_index_cache[cache_key] = index
+        return index
+
+
     def find_build_directories(self, test_file: Path) -> list[Path]:
         """
         Find build directories that may contain pre-compiled modules (.mod and .o files).
@@ -274,29 +731,79 @@ class ModuleDependencyResolver:
         list[Path]
             List of build directories found
         """
+        start: Path = test_file.resolve().parent
+
+        # Every test file in the same directory yields the same result
+        cached: list[Path] | None = self._build_dirs_cache.get(start)
+        if cached is not None:
+            return list(cached)
+
         build_dirs: list[Path] = []
-        current: Path = test_file.resolve().parent
+        current: Path = start
 
         # Search upward for build directories
         for _ in range(self.SEARCH_DEPTH_MAX):
             # Check for common build directory names
             for build_name in ["build", "Build", "BUILD"]:
                 build_dir = current / build_name
-                if build_dir.exists() and build_dir.is_dir():
+                if is_existing_dir(build_dir):
                     build_dirs.append(build_dir)
                     # Also search subdirectories of build/
-                    for subdir in build_dir.rglob("*"):
-                        if subdir.is_dir() and any(subdir.glob("*.mod")):
-                            build_dirs.append(subdir)
+                    build_dirs.extend(self.find_module_directories(build_dir))
 
             if current == current.parent:
                 break
             current = current.parent
 
-        return build_dirs
+        self._build_dirs_cache[start] = build_dirs
+        return list(build_dirs)
 
 
-    def _build_search_directories(self, test_file: Path) -> list[Path]:
+    def find_module_directories(self, root: Path) -> list[Path]:
+        """
+        Find subdirectories of root that contain compiled module (.mod) files.
+
+        Each directory is listed exactly once with os.scandir, so neither the
+        entries nor the .mod files are stat'ed separately.
+
+        Parameters
+        ----------
+        root : Path
+            Directory to search (not included in the result)
+
+        Returns
+        -------
+        list[Path]
+            Subdirectories containing at least one .mod file
+        """
+        module_dirs: list[Path] = []
+        stack: list[str] = [str(root)]
+
+        while stack:
+            current: str = stack.pop()
+            subdirs: list[str] = []
+            has_mod: bool = False
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif not has_mod and entry.name.endswith(".mod"):
+                            has_mod = True
+            except OSError:
+                # Skip directories we can't read
+                continue
+
+            if has_mod and current != str(root):
+                module_dirs.append(Path(current))
+
+            # Reverse so that directories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+        return module_dirs
+
+
+    def build_search_directories(self, test_file: Path) -> list[Path]:
         """
         Build list of directories to search for module files.
 
@@ -313,16 +820,22 @@ class ModuleDependencyResolver:
         list[Path]
             List of directories to search (deduplicated, order-preserved)
         """
+        start: Path = test_file.resolve().parent
+
+        # Every test file in the same directory yields the same result
+        cached: list[Path] | None = self._search_dirs_cache.get(start)
+        if cached is not None:
+            return list(cached)
+
         search_dirs: list[Path] = []
-        test_file_abs: Path = test_file.resolve()
 
         # Start from test file's parent and go up
-        current: Path = test_file_abs.parent
+        current: Path = start
         for _ in range(self.SEARCH_DEPTH_MAX):
             # Add common source directories
             for subdir in self.TARGET_SUBDIRS:
                 candidate = current / subdir
-                if candidate.exists() and candidate.is_dir():
+                if is_existing_dir(candidate):
                     search_dirs.append(candidate)
 
             # Also add current directory
@@ -335,14 +848,10 @@ class ModuleDependencyResolver:
             current = current.parent
 
         # Remove duplicates while preserving order
-        seen_dirs: set[Path] = set()
-        unique_dirs: list[Path] = []
-        for d in search_dirs:
-            if d not in seen_dirs:
-                seen_dirs.add(d)
-                unique_dirs.append(d)
+        unique_dirs: list[Path] = deduplicate(search_dirs)
 
-        return unique_dirs
+        self._search_dirs_cache[start] = unique_dirs
+        return list(unique_dirs)
 
 
     def _find_assertion_module(self, search_dirs: list[Path]) -> Path | None:
@@ -360,9 +869,19 @@ class ModuleDependencyResolver:
         Path | None
             Path to the assertion module file, or None if not found
         """
+        file_name: str = self.ASSERTION_FILE_NAME
+
+        # Probe the usual locations directly before walking any directory
+        for search_dir in search_dirs:
+            for candidate in (search_dir / file_name, search_dir / "src" / file_name):
+                if candidate.exists():
+                    if self._verbose:
+                        print(f"Using assertions from: {candidate}")
+                    return candidate
+
         for search_dir in search_dirs:
             for f90_file in self.find_fortran_files_recursive(search_dir, max_depth=2):
-                if f90_file.name != "module_fortest_assertions.f90":
+                if f90_file.name != file_name:
                     continue
 
                 if self._verbose:
@@ -371,7 +890,7 @@ class ModuleDependencyResolver:
                 return f90_file
 
         # Fallback: use bundled module located next to runner.py
-        bundled = Path(__file__).resolve().parent / "module_fortest_assertions.f90"
+        bundled = Path(__file__).resolve().parent / file_name
         if bundled.exists():
             if self._verbose:
                 print(f"Using bundled assertions from: {bundled}")
@@ -380,7 +899,7 @@ class ModuleDependencyResolver:
         return None
 
 
-    def _find_user_modules(
+    def find_user_modules(
         self,
         used_modules: list[str],
         search_dirs: list[Path],
@@ -405,26 +924,30 @@ class ModuleDependencyResolver:
         """
         modules: list[Path] = []
         test_file_abs: Path = test_file.resolve()
+        # Files already excluded or collected, for constant-time membership checks
+        seen: set[Path] = {test_file_abs}
+        # Loop invariants looked up once
+        skipped_modules: frozenset[str] = self.INTRINSIC_MODULES | {self.ASSERTION_MODULE}
+        find_module_file = self.find_module_file_by_name
+        verbose: bool = self._verbose
 
         for module_name in used_modules:
             # Skip intrinsic modules and fortest_assertions
-            if module_name in self.INTRINSIC_MODULES or module_name == self.ASSERTION_MODULE:
+            if module_name in skipped_modules:
                 continue
 
             # Find module file for this dependency
-            module_file = self.find_module_file_by_name(module_name, search_dirs)
+            module_file = find_module_file(module_name, search_dirs)
 
             if not module_file:
                 continue
 
-            is_test_file: bool = module_file == test_file_abs
-            is_in_modules: bool = module_file in modules
-
-            if is_test_file or is_in_modules:
+            if module_file in seen:
                 continue
 
+            seen.add(module_file)
             modules.append(module_file)
-            if self._verbose:
+            if verbose:
                 print(f"Found dependency: {module_file} (provides {module_name})")
 
         return modules
@@ -454,33 +977,38 @@ class ModuleDependencyResolver:
         processed : set[Path]
             Set of already processed files to avoid infinite recursion
         """
+        # Loop invariants looked up once for the whole traversal
         test_file_abs: Path = test_file.resolve()
+        skipped_modules: frozenset[str] = self.INTRINSIC_MODULES | {self.ASSERTION_MODULE}
+        find_module_file = self.find_module_file_by_name
+        extract_use_statements = self.extract_use_statements
+        verbose: bool = self._verbose
+
+        def visit(module_names: list[str]) -> None:
+            for module_name in module_names:
+                # Skip intrinsic modules and fortest_assertions
+                if module_name in skipped_modules:
+                    continue
 
-        for module_name in used_modules:
-            # Skip intrinsic modules and fortest_assertions
-            if module_name in self.INTRINSIC_MODULES or module_name == self.ASSERTION_MODULE:
-                continue
+                # Find module file for this dependency
+                module_file = find_module_file(module_name, search_dirs)
 
-            # Find module file for this dependency
-            module_file = self.find_module_file_by_name(module_name, search_dirs)
+                if not module_file:
+                    continue
 
-            if not module_file:
-                continue
+                # Skip test file and already processed modules
+                if module_file == test_file_abs or module_file in processed:
+                    continue
 
-            # Skip test file and already processed modules
-            if module_file == test_file_abs or module_file in processed:
-                continue
+                # Mark as processed to avoid infinite recursion
+                processed.add(module_file)
 
-            # Mark as processed to avoid infinite recursion
-            processed.add(module_file)
+                # Recursively find dependencies of this module FIRST
+                visit(extract_use_statements(module_file))
 
-            # Recursively find dependencies of this module FIRST
-            nested_modules = self.extract_use_statements(module_file)
-            self._find_user_modules_recursive(
-                nested_modules, search_dirs, test_file, modules, processed
-            )
+                # Add this module AFTER its dependencies
+                modules.append(module_file)
+                if verbose:
+                    print(f"Found dependency: {module_file} (provides {module_name})")
 
-            # Add this module AFTER its dependencies
-            modules.append(module_file)
-            if self._verbose:
-                print(f"Found dependency: {module_file} (provides {module_name})")
+        visit(used_modules)
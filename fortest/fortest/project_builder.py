@@ -2,13 +2,22 @@
 Module for building and compiling Fortran projects and tests.
 """
 
+import hashlib
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import ClassVar
 
 from fortest.build_system_detector import BuildSystemInfo, BuildSystemDetector
 from fortest.module_dependency_resolver import ModuleDependencyResolver
 from fortest.fortran_test_generator import FortranTestGenerator
 from fortest.test_result import Colors
+from fortest.utilities import deduplicate
 
 
 class ProjectBuilder:
@@ -18,12 +27,17 @@ class ProjectBuilder:
     Supports building with build systems (CMake, FPM, Make) and
     falls back to direct compilation with gfortran when needed.
     """
+    # Number of trailing characters of compiler diagnostics kept for error messages
+    STDERR_TAIL_MAX: ClassVar[int] = 4096
+
     def __init__(self,
         compiler: str = "gfortran",
         verbose: bool = False,
         detector: BuildSystemDetector | None = None,
         resolver: ModuleDependencyResolver | None = None,
         generator: FortranTestGenerator | None = None,
+        cache_dir: Path | None = None,
+        jobs: int = 1,
     ) -> None:
         """
         Initialize the project builder.
@@ -40,12 +54,56 @@ class ProjectBuilder:
             Module dependency resolver instance, by default None (creates new one)
         generator : FortranTestGenerator | None, optional
             Test code generator instance, by default None (creates new one)
+        cache_dir : Path | None, optional
+            Directory in which compiled objects and module files are kept between
+            runs. If None, everything is compiled in each run, by default None
+        jobs : int, optional
+            Maximum number of independent sources to compile at once, by default 1
         """
         self._compiler: str = compiler
         self._verbose: bool = verbose
+        self._jobs: int = jobs
         self._detector: BuildSystemDetector = detector or BuildSystemDetector(verbose)
         self._resolver: ModuleDependencyResolver = resolver or ModuleDependencyResolver(verbose)
-        self._generator: FortranTestGenerator = generator or FortranTestGenerator(verbose)
+        self._generator: FortranTestGenerator = generator or FortranTestGenerator(verbose, self._resolver)
+        # Objects of each test file's dependencies and test module, keyed by
+        # (test file, output directory); None records a failed compilation
+        self._test_objects_cache: dict[tuple[Path, Path], list[Path] | None] = {}
+        # Tests of one file may compile concurrently; the first compiles the
+        # objects while the others wait on the lock for that file
+        self._test_objects_locks: dict[tuple[Path, Path], threading.Lock] = {}
+        self._test_objects_locks_lock: threading.Lock = threading.Lock()
+        # Objects of module dependencies keyed by (resolved source, mtime_ns),
+        # shared by all test files of a run
+        self._module_objects_cache: dict[tuple[str, int], Path] = {}
+        # Persistent objects, keyed by a hash of the source, its dependencies
+        # and the compiler (see _object_cache_keys)
+        self._object_cache_dir: Path | None = cache_dir / "objects" if cache_dir is not None else None
+        self._compiler_identity: str | None = None
+        # SHA-256 of source files keyed by path, validated by (mtime_ns, size)
+        self._source_digest_cache: dict[str, tuple[str, int, int]] = {}
+        # Build systems run in the project directory, so builds are serialized
+        self._build_lock: threading.Lock = threading.Lock()
+        # Whether the build of each (project directory, build type) succeeded
+        self._built_projects: dict[tuple[Path, str], bool] = {}
+        # Held while a child process runs (see process_slot)
+        self._process_slots: threading.BoundedSemaphore = threading.BoundedSemaphore(max(jobs, 1))
+
+    def process_slot(self) -> threading.BoundedSemaphore:
+        """
+        Return the semaphore that bounds the child processes of a run.
+
+        Test files, the tests of a file and independent sources each run on
+        their own thread pool, and these pools nest. Every compiler, build
+        tool and test program is started while holding this semaphore, so
+        together they never run more than jobs processes at once.
+
+        Returns
+        -------
+        threading.BoundedSemaphore
+            Semaphore to hold with a with statement while a child process runs
+        """
+        return self._process_slots
 
     def build_with_system(self, build_info: BuildSystemInfo, test_file: Path) -> Path | None:
         """
@@ -65,22 +123,35 @@ class ProjectBuilder:
         """
         build_type: str = build_info.build_type
         project_dir: Path = build_info.project_dir
-
-        if self._verbose:
-            print(f"Building with {build_type} in {project_dir}")
+        build_key: tuple[Path, str] = (project_dir, build_type)
 
         try:
-            if build_type == "cmake":
-                return self._build_with_cmake(project_dir, test_file)
-            elif build_type == "fpm":
-                return self._build_with_fpm(project_dir, test_file)
-            elif build_type == "make":
-                return self._build_with_make(project_dir, test_file)
+            with self._build_lock:
+                # A project is built once per run; its other test files only
+                # look up their executables
+                built: bool | None = self._built_projects.get(build_key)
+                if built is False:
+                    return None
+                if built is None:
+                    if self._verbose:
+                        print(f"Building with {build_type} in {project_dir}")
+                    self._built_projects[build_key] = False
+                    if build_type == "cmake":
+                        self._build_with_cmake(project_dir)
+                    elif build_type == "fpm":
+                        self._build_with_fpm(project_dir)
+                    elif build_type == "make":
+                        self._build_with_make(project_dir)
+                    else:
+                        return None
+                    self._built_projects[build_key] = True
+
+            return self._find_built_executable(build_type, project_dir, test_file)
 
         except subprocess.CalledProcessError as e:
             print(
-                f"{Colors.RED.value}Build failed with {build_type}"
-                f"{Colors.RESET.value}"
+                f"{Colors.RED}Build failed with {build_type}"
+                f"{Colors.RESET}"
             )
             if self._verbose:
                 print(e.stderr)
@@ -90,6 +161,35 @@ class ProjectBuilder:
                 print(f"Error during build: {e}")
             return None
 
+    def _find_built_executable(
+        self,
+        build_type: str,
+        project_dir: Path,
+        test_file: Path,
+    ) -> Path | None:
+        """
+        Find the executable of a test file in a project built by a build system.
+
+        Parameters
+        ----------
+        build_type : str
+            Build system type ("cmake", "fpm" or "make")
+        project_dir : Path
+            Project directory
+        test_file : Path
+            Path to the test file
+
+        Returns
+        -------
+        Path | None
+            Path to the test executable if found, None otherwise
+        """
+        if build_type == "cmake":
+            return self._detector.find_cmake_executable(project_dir / "build", test_file)
+        elif build_type == "fpm":
+            return self._detector.find_fpm_executable(project_dir, test_file)
+        elif build_type == "make":
+            return self._detector.find_make_executable(project_dir, test_file)
         return None
 
     def compile_test(
@@ -139,19 +239,28 @@ class ProjectBuilder:
                 return None, "Compilation failed"
             return executable, None
 
-        # Check if this is a standalone program or module-based test
-        if self._is_standalone_program(test_file):
+        # Check if this is a standalone program or module-based test.
+        # error_stop tests are always standalone, so their file is not read here.
+        kind: str
+        test_module_name: str | None
+        if "error_stop" in test_file.name.lower():
+            kind, test_module_name = "program", None
+        else:
+            kind, test_module_name = self._resolver.classify_test_file(test_file)
+        if kind == "program":
             executable = self._compile_standalone_program(test_file, output_dir)
             if executable is None:
                 return None, "Compilation failed"
             return executable, None
         else:
-            executable = self._compile_module_test(test_file, output_dir)
+            executable = self._compile_module_test(
+                test_file, output_dir, test_module_name=test_module_name
+            )
             if executable is None:
                 return None, "Compilation failed"
             return executable, None
 
-    def _build_with_cmake(self, project_dir: Path, test_file: Path) -> Path | None:
+    def _build_with_cmake(self, project_dir: Path) -> None:
         """
         Build the project using CMake.
 
@@ -159,38 +268,30 @@ class ProjectBuilder:
         ----------
         project_dir : Path
             CMake project directory
-        test_file : Path
-            Path to the test file
 
-        Returns
-        -------
-        Path | None
-            Path to the test executable if found, None otherwise
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If configuring or building fails
         """
         build_dir: Path = project_dir / "build"
         build_dir.mkdir(exist_ok=True)
 
         # Run cmake configuration
-        subprocess.run(
-            ["cmake", ".."],
-            cwd=build_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        with self._process_slots:
+            subprocess.run(
+                ["cmake", ".."],
+                cwd=build_dir,
+                stdout=None if self._verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
 
         # Build
-        subprocess.run(
-            ["make"],
-            cwd=build_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        return self._detector.find_cmake_executable(build_dir, test_file)
+        self._run_make(build_dir)
 
-    def _build_with_fpm(self, project_dir: Path, test_file: Path) -> Path | None:
+    def _build_with_fpm(self, project_dir: Path) -> None:
         """
         Build the project using FPM (Fortran Package Manager).
 
@@ -198,25 +299,23 @@ class ProjectBuilder:
         ----------
         project_dir : Path
             FPM project directory
-        test_file : Path
-            Path to the test file
 
-        Returns
-        -------
-        Path | None
-            Path to the test executable if found, None otherwise
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the build fails
         """
-        subprocess.run(
-            ["fpm", "build"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        return self._detector.find_fpm_executable(project_dir, test_file)
+        with self._process_slots:
+            subprocess.run(
+                ["fpm", "build"],
+                cwd=project_dir,
+                stdout=None if self._verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
 
-    def _build_with_make(self, project_dir: Path, test_file: Path) -> Path | None:
+    def _build_with_make(self, project_dir: Path) -> None:
         """
         Build the project using Make.
 
@@ -224,47 +323,100 @@ class ProjectBuilder:
         ----------
         project_dir : Path
             Make project directory
-        test_file : Path
-            Path to the test file
 
-        Returns
-        -------
-        Path | None
-            Path to the test executable if found, None otherwise
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the build fails
         """
-        subprocess.run(
-            ["make"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        return self._detector.find_make_executable(project_dir, test_file)
+        self._run_make(project_dir)
 
-    def _is_standalone_program(self, test_file: Path) -> bool:
+    def _run_make(self, make_dir: Path) -> None:
         """
-        Check if a test file is a standalone program (not a module).
+        Run make, with as many parallel jobs as the builder is allowed.
+
+        Makefiles that do not declare every Fortran module dependency can fail
+        when run in parallel, so a failed parallel build is finished serially;
+        make keeps the targets already built. make holds a single process
+        slot; the jobs it starts itself are bounded by -j.
 
         Parameters
         ----------
-        test_file : Path
-            Path to the test file
+        make_dir : Path
+            Directory containing the Makefile
 
-        Returns
-        -------
-        bool
-            True if the file contains a program statement or is an error_stop test
-        """
-        import re
-        with open(test_file, "r") as f:
-            content: str = f.read()
-        is_program = re.search(
-            r"\bprogram\s+\w+",
-            content,
-            re.IGNORECASE,
-        )
-        return "error_stop" in test_file.name.lower() or is_program is not None
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the serial build fails
+        """
+        make_cmd: list[str] = ["make"]
+        if self._jobs > 1:
+            try:
+                with self._process_slots:
+                    subprocess.run(
+                        [*make_cmd, f"-j{self._jobs}"],
+                        cwd=make_dir,
+                        stdout=None if self._verbose else subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        check=True,
+                    )
+                return
+            except subprocess.CalledProcessError:
+                if self._verbose:
+                    print("Parallel make failed, retrying serially")
+
+        with self._process_slots:
+            subprocess.run(
+                make_cmd,
+                cwd=make_dir,
+                stdout=None if self._verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+
+    def _run_compiler(self, compile_cmd: list[str], cwd: Path | None = None) -> None:
+        """
+        Run a compiler command.
+
+        In verbose mode the compiler writes directly to the terminal. Otherwise
+        stdout is discarded and stderr is streamed, keeping only its tail so that
+        large diagnostics never have to be buffered in full.
+
+        Parameters
+        ----------
+        compile_cmd : list[str]
+            Compiler command line
+        cwd : Path | None, optional
+            Working directory for the compiler, by default None (current directory)
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the compiler exits with a non-zero status. Its stderr holds the last
+            STDERR_TAIL_MAX characters of diagnostics (None in verbose mode).
+        """
+        stdout = None if self._verbose else subprocess.DEVNULL
+        stderr = None if self._verbose else subprocess.PIPE
+        stderr_tail: str | None = None
+
+        with self._process_slots, subprocess.Popen(
+            compile_cmd, stdout=stdout, stderr=stderr, text=True, cwd=cwd
+        ) as process:
+            if process.stderr is not None:
+                stderr_tail = ""
+                tail_max: int = self.STDERR_TAIL_MAX
+                for chunk in iter(partial(process.stderr.read, tail_max), ""):
+                    stderr_tail = (stderr_tail + chunk)[-tail_max:]
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                compile_cmd,
+                stderr=stderr_tail,
+            )
 
     def _compile_standalone_program(self, test_file: Path, output_dir: Path) -> Path | None:
         """
@@ -295,19 +447,15 @@ class ProjectBuilder:
             print(f"Compiling standalone program: {' '.join(compile_cmd)}")
 
         try:
-            subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            self._run_compiler(compile_cmd)
             return executable
         except subprocess.CalledProcessError as e:
             print(
-                f"{Colors.RED.value}Compilation failed for {test_file}"
-                f"{Colors.RESET.value}"
+                f"{Colors.RED}Compilation failed for {test_file}"
+                f"{Colors.RESET}"
             )
-            print(e.stderr)
+            if e.stderr:
+                print(e.stderr)
             return None
 
     def _compile_module_test(
@@ -315,6 +463,7 @@ class ProjectBuilder:
         test_file: Path,
         output_dir: Path,
         program_file: Path | None = None,
+        test_module_name: str | None = None,
     ) -> Path | None:
         """
         Compile a module-based test file with its dependencies.
@@ -327,6 +476,8 @@ class ProjectBuilder:
             Directory for output executable
         program_file : Path | None, optional
             Optional pre-generated program file to use instead of generating one
+        test_module_name : str | None, optional
+            Module name of the test file if already known, by default None (extracted from the file)
 
         Returns
         -------
@@ -334,27 +485,44 @@ class ProjectBuilder:
             Path to the compiled executable, or None if compilation failed
         """
         # Extract test information
-        test_module_name: str | None = self._resolver.extract_module_name(test_file)
+        if test_module_name is None:
+            test_module_name = self._resolver.extract_module_name(test_file)
         if not test_module_name:
             print(
-                f"{Colors.YELLOW.value}Warning: Could not find module in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: Could not find module in "
+                f"{test_file}{Colors.RESET}"
             )
             return None
 
         test_subroutines: list[str] = self._generator.extract_test_subroutines(test_file)
         if not test_subroutines:
             print(
-                f"{Colors.YELLOW.value}Warning: No test subroutines found in "
-                f"{test_file}{Colors.RESET.value}"
+                f"{Colors.YELLOW}Warning: No test subroutines found in "
+                f"{test_file}{Colors.RESET}"
             )
             return None
 
         # Find module dependencies (including assertions for standalone mode)
         module_files: list[Path] = self._resolver.find_module_files(test_file, include_assertions=True)
 
+        executable = output_dir / test_file.stem
+
         # Use provided program file or generate one
         if program_file is not None:
+            # Named after the program, so tests of a file can build concurrently
+            executable = output_dir / program_file.stem
+
+            # Per-subroutine programs share the compiled dependencies and test
+            # module, so only the small program itself is compiled per call
+            sources: list[Path] = [*module_files, test_file]
+            if len({f.stem for f in sources}) == len(sources):
+                objects: list[Path] | None = self._compile_test_objects(
+                    test_file, sources, output_dir
+                )
+                if objects is None:
+                    return None
+                return self._link_test_program(program_file, objects, output_dir, executable)
+
             main_program = program_file
         else:
             # Generate main program
@@ -366,7 +534,6 @@ class ProjectBuilder:
             )
 
         # Compile all files
-        executable = output_dir / test_file.stem
         compile_cmd = [
             self._compiler,
             "-J", str(output_dir),
@@ -382,19 +549,480 @@ class ProjectBuilder:
             print(f"Compiling: {' '.join(compile_cmd)}")
 
         try:
-            subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                check=True,
+            self._run_compiler(compile_cmd)
+            return executable
+        except subprocess.CalledProcessError as e:
+            print(
+                f"{Colors.RED}Compilation failed for {test_file}"
+                f"{Colors.RESET}"
+            )
+            if e.stderr:
+                print(e.stderr)
+            return None
+
+    def _compile_test_objects(
+        self,
+        test_file: Path,
+        sources: list[Path],
+        output_dir: Path,
+    ) -> list[Path] | None:
+        """
+        Compile a test module and its dependencies to objects once per test file.
+
+        All sources are passed to a single compiler invocation, in dependency
+        order, so that each module file is available to the ones after it.
+
+        Parameters
+        ----------
+        test_file : Path
+            Path to the test file
+        sources : list[Path]
+            Module files in dependency order followed by the test file.
+            Their stems must be unique.
+        output_dir : Path
+            Directory for module files; objects go to a subdirectory of it
+
+        Returns
+        -------
+        list[Path] | None
+            Object files in the order of sources, or None if compilation failed
+        """
+        cache_key: tuple[Path, Path] = (test_file, output_dir)
+        with self._test_objects_locks_lock:
+            lock: threading.Lock = self._test_objects_locks.setdefault(cache_key, threading.Lock())
+        with lock:
+            if cache_key in self._test_objects_cache:
+                return self._test_objects_cache[cache_key]
+            objects: list[Path] | None = self._compile_objects(test_file, sources, output_dir)
+            self._test_objects_cache[cache_key] = objects
+            return objects
+
+    def compile_shared_modules(self, test_files: list[Path], output_dir: Path) -> None:
+        """
+        Compile the module dependencies that several test files have in common.
+
+        Test files built concurrently would otherwise each compile their common
+        dependencies, such as fortest_assertions, before any of them had been
+        reused. The objects go to the per-run cache that later compilations in
+        subdirectories of output_dir reuse. A failure is left for the test
+        files themselves to report.
+
+        Parameters
+        ----------
+        test_files : list[Path]
+            Module-based test files about to be built
+        output_dir : Path
+            Directory whose subdirectories the test files are built in
+        """
+        # Dependency lists are closed under use, so the first-seen order of
+        # the shared modules is a valid dependency order
+        counts: dict[Path, int] = {}
+        for test_file in test_files:
+            for module_file in self._resolver.find_module_files(test_file, include_assertions=True):
+                counts[module_file] = counts.get(module_file, 0) + 1
+        shared: list[Path] = [module_file for module_file, count in counts.items() if count > 1]
+        if not shared or len({f.stem for f in shared}) != len(shared):
+            return
+
+        self._compile_objects(Path("shared_modules"), shared, output_dir)
+
+    def _compile_objects(
+        self,
+        test_file: Path,
+        sources: list[Path],
+        output_dir: Path,
+    ) -> list[Path] | None:
+        """
+        Compile sources to objects with a single compiler invocation.
+
+        Module dependencies already compiled for another test file, and not
+        modified since, are reused instead of being compiled again. With more
+        than one job, sources that do not depend on each other are compiled
+        concurrently, one compiler per source (see _compile_levels).
+
+        Parameters
+        ----------
+        test_file : Path
+            Path to the test file, which names the objects directory
+        sources : list[Path]
+            Module files in dependency order followed by the test file.
+            Their stems must be unique.
+        output_dir : Path
+            Directory for module files; objects go to a subdirectory of it
+
+        Returns
+        -------
+        list[Path] | None
+            Object files in the order of sources, or None if compilation failed
+        """
+        # gfortran names each object after its source in the working directory
+        module_dir: Path = output_dir.resolve()
+        objects_dir: Path = module_dir / f"objects_{test_file.stem}"
+        objects_dir.mkdir(parents=True, exist_ok=True)
+
+        objects: list[Path] = []
+        compiled: list[tuple[Path, tuple[str, int] | None, str | None]] = []
+        cache_keys: list[str | None] = self._object_cache_keys(sources)
+        for source, cache_key in zip(sources, cache_keys):
+            source_abs: Path = source.resolve()
+            key: tuple[str, int] | None = None
+            if source is not test_file:
+                try:
+                    key = (str(source_abs), source_abs.stat().st_mtime_ns)
+                except OSError:
+                    pass
+            reused: Path | None = self._module_objects_cache.get(key) if key else None
+            if reused is not None:
+                objects.append(reused)
+                continue
+
+            obj: Path = objects_dir / f"{source.stem}.o"
+            objects.append(obj)
+            if cache_key is not None and self._restore_cached_object(cache_key, obj, module_dir):
+                if self._verbose:
+                    print(f"Using cached object for {source_abs}")
+                if key is not None:
+                    self._module_objects_cache[key] = obj
+            else:
+                compiled.append((source_abs, key, cache_key))
+
+        if not compiled:
+            return objects
+
+        compile_cmd: list[str] = [
+            self._compiler,
+            "-c",
+            "-J", str(module_dir),
+        ]
+        # Objects sit in a subdirectory of the directory holding their module files
+        for reused_dir in deduplicate(obj.parent.parent for obj in objects):
+            if reused_dir != module_dir:
+                compile_cmd.extend(["-I", str(reused_dir)])
+        sources_abs: list[Path] = [source_abs for source_abs, _, _ in compiled]
+        levels: list[list[Path]] = self._compile_levels(sources_abs)
+        # Concurrent compilers would interleave their verbose output
+        if self._jobs <= 1 or self._verbose or len(levels) == len(sources_abs):
+            levels = [sources_abs]
+
+        try:
+            for level in levels:
+                self._compile_level(compile_cmd, level, objects_dir)
+        except subprocess.CalledProcessError as e:
+            print(
+                f"{Colors.RED}Compilation failed for {test_file}"
+                f"{Colors.RESET}"
+            )
+            if e.stderr:
+                print(e.stderr)
+            return None
+
+        for source_abs, key, cache_key in compiled:
+            obj = objects_dir / f"{source_abs.stem}.o"
+            if key is not None:
+                self._module_objects_cache[key] = obj
+            if cache_key is not None:
+                self._store_cached_object(cache_key, source_abs, obj, module_dir)
+        return objects
+
+    def _compile_levels(self, sources: list[Path]) -> list[list[Path]]:
+        """
+        Group sources into levels that only use modules of earlier levels.
+
+        Parameters
+        ----------
+        sources : list[Path]
+            Sources in dependency order
+
+        Returns
+        -------
+        list[list[Path]]
+            Levels in compile order, each keeping the order of sources
+        """
+        module_levels: dict[str, int] = {}
+        levels: list[list[Path]] = []
+        for source in sources:
+            info = self._resolver.parse_fortran_file(source)
+            level: int = max(
+                (module_levels[used] + 1 for used in info.used_modules if used in module_levels),
+                default=0,
             )
+            for name in info.module_names:
+                module_levels[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(source)
+        return levels
+
+    def _compile_level(self, compile_cmd: list[str], sources: list[Path], cwd: Path) -> None:
+        """
+        Compile sources that do not use each other's modules.
+
+        A single source, or all sources when running with one job, are passed
+        to one compiler invocation; otherwise each source gets its own.
+
+        Parameters
+        ----------
+        compile_cmd : list[str]
+            Compiler command line without the sources
+        sources : list[Path]
+            Sources to compile
+        cwd : Path
+            Working directory, which receives the objects
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If a compilation fails
+        """
+        if len(sources) == 1 or self._jobs <= 1 or self._verbose:
+            level_cmd: list[str] = compile_cmd + [str(source) for source in sources]
+            if self._verbose:
+                print(f"Compiling test objects: {' '.join(level_cmd)}")
+            self._run_compiler(level_cmd, cwd=cwd)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self._jobs, len(sources))) as pool:
+            # Consuming the results re-raises the first failure
+            list(pool.map(
+                lambda source: self._run_compiler(compile_cmd + [str(source)], cwd=cwd),
+                sources,
+            ))
+
+    def _object_cache_keys(self, sources: list[Path]) -> list[str | None]:
+        """
+        Compute the persistent object cache key of each source.
+
+        A key hashes the compiler, the compile flags, the source contents and
+        the keys of the modules it uses from earlier sources, so a change to
+        a module also invalidates the objects compiled against it.
+
+        Parameters
+        ----------
+        sources : list[Path]
+            Sources in dependency order
+
+        Returns
+        -------
+        list[str | None]
+            Key of each source, or None if it is not cached: caching is off,
+            the source cannot be read, it defines no module, or it uses a
+            module of an uncached source
+        """
+        if self._object_cache_dir is None:
+            return [None] * len(sources)
+
+        compiler_identity: bytes = self._get_compiler_identity().encode()
+        module_keys: dict[str, str | None] = {}
+        keys: list[str | None] = []
+        for source in sources:
+            info = self._resolver.parse_fortran_file(source)
+            digest: str | None = self._source_digest(source)
+            key: str | None = None
+            if digest is not None and info.module_names and info.program_name is None:
+                hasher = hashlib.sha256(compiler_identity)
+                hasher.update(b"\0-c\0")
+                hasher.update(digest.encode())
+                for used in info.used_modules:
+                    if used not in module_keys:
+                        continue
+                    used_key: str | None = module_keys[used]
+                    if used_key is None:
+                        break
+                    hasher.update(f"\0{used}={used_key}".encode())
+                else:
+                    key = hasher.hexdigest()
+            for name in info.module_names:
+                module_keys[name] = key
+            keys.append(key)
+        return keys
+
+    def _get_compiler_identity(self) -> str:
+        """
+        Return the compiler path and version, determined once per builder.
+
+        Returns
+        -------
+        str
+            Resolved compiler path and the first line of its --version output
+        """
+        if self._compiler_identity is None:
+            version: str = ""
+            try:
+                with self._process_slots:
+                    result = subprocess.run(
+                        [self._compiler, "--version"],
+                        capture_output=True,
+                        text=True,
+                    )
+                version = result.stdout.split("\n", 1)[0]
+            except OSError:
+                pass
+            self._compiler_identity = f"{shutil.which(self._compiler) or self._compiler}\0{version}"
+        return self._compiler_identity
+
+    def _source_digest(self, source: Path) -> str | None:
+        """
+        Return the SHA-256 of a source file, reusing it while the file is unchanged.
+
+        Parameters
+        ----------
+        source : Path
+            Source file
+
+        Returns
+        -------
+        str | None
+            Hex digest, or None if the file cannot be read
+        """
+        path: str = str(source)
+        try:
+            st: os.stat_result = os.stat(path)
+            cached: tuple[str, int, int] | None = self._source_digest_cache.get(path)
+            if cached is not None and cached[1:] == (st.st_mtime_ns, st.st_size):
+                return cached[0]
+            with open(path, "rb") as f:
+                digest: str = hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            return None
+        self._source_digest_cache[path] = (digest, st.st_mtime_ns, st.st_size)
+        return digest
+
+    def _restore_cached_object(self, cache_key: str, obj: Path, module_dir: Path) -> bool:
+        """
+        Copy a cached object and its module files into the build directories.
+
+        Parameters
+        ----------
+        cache_key : str
+            Key of the cache entry
+        obj : Path
+            Path to which the object is copied
+        module_dir : Path
+            Directory to which the module files are copied
+
+        Returns
+        -------
+        bool
+            True if the entry existed and was restored
+        """
+        if self._object_cache_dir is None:
+            return False
+        entry_dir: Path = self._object_cache_dir / cache_key[:2] / cache_key
+        try:
+            with os.scandir(entry_dir) as entries:
+                mod_files: list[str] = [e.name for e in entries if e.name.endswith(".mod")]
+            for mod_file in mod_files:
+                shutil.copyfile(entry_dir / mod_file, module_dir / mod_file)
+            shutil.copyfile(entry_dir / "object.o", obj)
+        except OSError:
+            return False
+        return True
+
+    def _store_cached_object(
+        self,
+        cache_key: str,
+        source: Path,
+        obj: Path,
+        module_dir: Path,
+    ) -> None:
+        """
+        Keep a compiled object and the module files of its source for later runs.
+
+        The entry is assembled in a temporary directory and renamed into place,
+        so concurrent runs never see a partial entry. A source whose module
+        files are not all in module_dir is not stored. Failures are ignored;
+        the object is simply compiled again next time.
+
+        Parameters
+        ----------
+        cache_key : str
+            Key of the cache entry
+        source : Path
+            Source file the object was compiled from
+        obj : Path
+            Compiled object
+        module_dir : Path
+            Directory holding the module files written by the compiler
+        """
+        if self._object_cache_dir is None:
+            return
+        entry_dir: Path = self._object_cache_dir / cache_key[:2] / cache_key
+        if entry_dir.exists():
+            return
+
+        mod_files: list[str] = [
+            f"{name}.mod" for name in self._resolver.parse_fortran_file(source).module_names
+        ]
+        # An entry without all module files could not satisfy later users
+        if not all((module_dir / mod_file).is_file() for mod_file in mod_files):
+            return
+        try:
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging_dir: Path = Path(tempfile.mkdtemp(dir=entry_dir.parent))
+        except OSError:
+            return
+        try:
+            shutil.copyfile(obj, staging_dir / "object.o")
+            for mod_file in mod_files:
+                shutil.copyfile(module_dir / mod_file, staging_dir / mod_file)
+            os.rename(staging_dir, entry_dir)
+        except OSError:
+            # A file vanished, or another run stored the entry first
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _link_test_program(
+        self,
+        program_file: Path,
+        objects: list[Path],
+        output_dir: Path,
+        executable: Path,
+    ) -> Path | None:
+        """
+        Compile a generated test program and link it with precompiled objects.
+
+        Parameters
+        ----------
+        program_file : Path
+            Path to the generated program file
+        objects : list[Path]
+            Object files of the dependencies and the test module
+        output_dir : Path
+            Directory holding the module files
+        executable : Path
+            Path for the output executable
+
+        Returns
+        -------
+        Path | None
+            Path to the compiled executable, or None if compilation failed
+        """
+        compile_cmd: list[str] = [
+            self._compiler,
+            "-I", str(output_dir),
+            "-J", str(output_dir),
+            "-o", str(executable),
+        ]
+        # Reused dependencies keep their module files next to their objects' directory
+        module_dir: Path = output_dir.resolve()
+        for reused_dir in deduplicate(obj.parent.parent for obj in objects):
+            if reused_dir != module_dir:
+                compile_cmd.extend(["-I", str(reused_dir)])
+        compile_cmd.extend(str(obj) for obj in objects)
+        compile_cmd.append(str(program_file))
+
+        if self._verbose:
+            print(f"Compiling: {' '.join(compile_cmd)}")
+
+        try:
+            self._run_compiler(compile_cmd)
             return executable
         except subprocess.CalledProcessError as e:
             print(
-                f"{Colors.RED.value}Compilation failed for {test_file}"
-                f"{Colors.RESET.value}"
+                f"{Colors.RED}Compilation failed for {program_file}"
+                f"{Colors.RESET}"
             )
-            print(e.stderr)
+            if e.stderr:
+                print(e.stderr)
             return None
 
     def compile_module_dependencies(
@@ -422,8 +1050,21 @@ class ProjectBuilder:
             Returns ([], None) on success, ([], error_msg) on failure
         """
         build_dirs = self._resolver.find_build_directories(test_file)
-        compiled_objects: list[Path] = []
 
+        # One compiler run for all modules; objects are named after their
+        # sources, so this needs unique stems
+        if len(module_files) > 1 and len({f.stem for f in module_files}) == len(module_files):
+            compiled_objects: list[Path] | None = self._compile_modules_together(
+                module_files,
+                build_dirs,
+                output_dir,
+            )
+            if compiled_objects is not None:
+                return compiled_objects, None
+
+            # Compile one module at a time to report the one that fails
+
+        compiled_objects = []
         for module_file in module_files:
             compile_result = self._compile_single_module(
                 module_file,
@@ -438,6 +1079,48 @@ class ProjectBuilder:
 
         return compiled_objects, None
 
+    def _compile_modules_together(
+        self,
+        module_files: list[Path],
+        build_dirs: list[Path],
+        output_dir: Path,
+    ) -> list[Path] | None:
+        """
+        Compile module files with a single compiler invocation.
+
+        Parameters
+        ----------
+        module_files : list[Path]
+            Module files in dependency order, with unique stems
+        build_dirs : list[Path]
+            Build directories for module search path
+        output_dir : Path
+            Directory for output objects and module files
+
+        Returns
+        -------
+        list[Path] | None
+            Paths to compiled object files, or None on failure
+        """
+        # gfortran writes each object to the working directory
+        output_dir_abs: Path = output_dir.resolve()
+        compile_mod_cmd = [self._compiler, "-c"]
+        compile_mod_cmd.extend(str(f.resolve()) for f in module_files)
+
+        for build_dir in build_dirs:
+            compile_mod_cmd.extend(["-I", str(build_dir.resolve())])
+
+        compile_mod_cmd.extend(["-J", str(output_dir_abs)])
+
+        if self._verbose:
+            print(f"Compiling module dependencies: {' '.join(compile_mod_cmd)}")
+
+        try:
+            self._run_compiler(compile_mod_cmd, cwd=output_dir_abs)
+            return [output_dir / f"{f.stem}.o" for f in module_files]
+        except subprocess.CalledProcessError:
+            return None
+
     def _compile_single_module(
         self,
         module_file: Path,
@@ -476,16 +1159,11 @@ class ProjectBuilder:
             print(f"Compiling module dependency: {' '.join(compile_mod_cmd)}")
 
         try:
-            subprocess.run(
-                compile_mod_cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            self._run_compiler(compile_mod_cmd)
             return output_obj
 
         except subprocess.CalledProcessError as e:
-            print(f"{Colors.RED.value}Compilation error:{Colors.RESET.value}")
+            print(f"{Colors.RED}Compilation error:{Colors.RESET}")
             print(f"  Module: {module_file.name}")
             if e.stderr:
                 print(f"  Error details:")
@@ -536,16 +1214,11 @@ class ProjectBuilder:
             print(f"Compiling test: {' '.join(compile_cmd)}")
 
         try:
-            subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            self._run_compiler(compile_cmd)
             return None
 
         except subprocess.CalledProcessError as e:
             if e.stderr:
-                print(f"{Colors.RED.value}Compilation error:{Colors.RESET.value}")
+                print(f"{Colors.RED}Compilation error:{Colors.RESET}")
                 print(e.stderr)
-            return f"Compilation failed: {e.stderr}"
+            return f"Compilation failed: {e.stderr}" if e.stderr else "Compilation failed"
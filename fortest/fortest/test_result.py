@@ -3,12 +3,14 @@
 Module defining test result structures and enums.
 """
 
-from enum import Enum
+from enum import StrEnum
 
 
-class Colors(Enum):
+class Colors(StrEnum):
     """
     ANSI color codes for terminal output.
+
+    Members are strings, so they can be interpolated without .value.
     """
     RED = "\033[31m"
     GREEN = "\033[32m"
@@ -18,7 +20,7 @@ class Colors(Enum):
     BOLD = "\033[1m"
 
 
-class MessageTag(Enum):
+class MessageTag(StrEnum):
     """
     Test result message tags.
     """
@@ -26,6 +28,11 @@ class MessageTag(Enum):
     FAIL = "[FAIL]"
 
 
+# Colored tags that start each printed test result
+PASS_PREFIX: str = f"{Colors.GREEN}{MessageTag.PASS}{Colors.RESET} "
+FAIL_PREFIX: str = f"{Colors.RED}{MessageTag.FAIL}{Colors.RESET} "
+
+
 class TestResult:
     """
     Container for test execution results.
@@ -41,6 +48,9 @@ class TestResult:
     """
     # Prevent pytest from collecting this as a test class (it has an __init__)
     __test__ = False
+    # Results are created per test; slots avoid a __dict__ per instance
+    __slots__ = ("name", "passed", "message")
+
     def __init__(self,
         name: str,
         passed: bool,
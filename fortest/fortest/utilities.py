@@ -2,15 +2,27 @@
 A module providing functions for general purposes.
 """
 
-from typing import Any, TypeVar, Iterable
+import io
+import os
+import stat
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, TypeVar, Iterable, Sequence
 
 T = TypeVar("T")
 
+_thread_output = threading.local()
+
 
 def deduplicate(input_list: Iterable[T]) -> list[T]:
     """
     Returns a list of unique elements while preserving original order.
 
+    Hashable elements are deduplicated with dict.fromkeys. If any element
+    is unhashable, elements are compared by equality instead, which takes
+    quadratic time.
+
     Parameters
     ----------
     input_list : Iterable[T]
@@ -21,4 +33,115 @@ def deduplicate(input_list: Iterable[T]) -> list[T]:
     list[T]
         A new list with unique elements in their original order.
     """
-    return list(dict.fromkeys(input_list))
\ No newline at end of file
+    # An iterator would be partly consumed before an unhashable element is met
+    items: Iterable[T] = input_list if isinstance(input_list, Sequence) else list(input_list)
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        unique: list[T] = []
+        for item in items:
+            if item not in unique:
+                unique.append(item)
+        return unique
+
+
+def is_existing_dir(path: str | os.PathLike[str]) -> bool:
+    """
+    Returns whether a path exists and is a directory, using a single stat call.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        The path to check.
+
+    Returns
+    -------
+    bool
+        True if the path exists and is a directory (following symlinks).
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def available_cpu_count() -> int:
+    """
+    Returns the number of CPUs the current process may run on.
+
+    Uses the scheduler affinity mask where available, so CPU limits set
+    by containers or taskset are respected, and falls back to os.cpu_count.
+
+    Returns
+    -------
+    int
+        The number of usable CPUs, at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+class _ThreadOutputRouter(io.TextIOBase):
+    """
+    Stand-in for sys.stdout that sends each thread's writes to its own buffer.
+
+    Threads without a buffer write to the wrapped stream.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+
+    def write(self, text: str) -> int:
+        buffer: io.StringIO | None = getattr(_thread_output, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stream.write(text)
+
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+
+
+@contextmanager
+def route_thread_output() -> Iterator[None]:
+    """
+    Routes writes to sys.stdout to per-thread buffers while active.
+
+    Buffers are set per thread with set_thread_output.
+    """
+    stream: Any = sys.stdout
+    sys.stdout = _ThreadOutputRouter(stream)
+    try:
+        yield
+    finally:
+        sys.stdout = stream
+
+
+def set_thread_output(buffer: io.StringIO | None) -> None:
+    """
+    Sets the buffer that receives the current thread's output.
+
+    Parameters
+    ----------
+    buffer : io.StringIO | None
+        The buffer to write to, or None to write to the original stream.
+    """
+    _thread_output.buffer = buffer
+
+
+def get_thread_output() -> io.StringIO | None:
+    """
+    Returns the buffer that receives the current thread's output.
+
+    Returns
+    -------
+    io.StringIO | None
+        The buffer set with set_thread_output, or None if there is none.
+    """
+    return getattr(_thread_output, "buffer", None)
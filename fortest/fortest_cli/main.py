@@ -4,6 +4,7 @@ CLI entry for fortest (thin wrapper).
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +12,16 @@ from fortest import __version__ as FORTEST_VERSION
 from fortest.exit_status import ExitStatus
 from fortest.test_result import Colors
 from fortest.fortran_test_runner import FortranTestRunner
+from fortest.utilities import available_cpu_count
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the default cache directory for fortest.
+    """
+    xdg_cache_home: str | None = os.environ.get("XDG_CACHE_HOME")
+    base: Path = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "fortest"
 
 
 def get_arguments() -> argparse.Namespace:
@@ -43,6 +54,26 @@ def get_arguments() -> argparse.Namespace:
         type=Path,
         help="Build directory (default: temporary directory)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=default_cache_dir(),
+        help="Directory for caches kept between runs "
+             "(default: $XDG_CACHE_HOME/fortest or ~/.cache/fortest)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the cache directory",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=available_cpu_count(),
+        help="Number of tests to compile and run in parallel "
+             "(default: number of available CPUs)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -62,12 +93,14 @@ def main() -> int:
             compiler=args.compiler,
             verbose=args.verbose,
             build_dir=args.build_dir,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            jobs=args.jobs,
         )
         test_files = runner.find_test_files(args.pattern)
         if not test_files:
             print(
-                f"{Colors.YELLOW.value}No test files matching '{args.pattern}' found"
-                f"{Colors.RESET.value}"
+                f"{Colors.YELLOW}No test files matching '{args.pattern}' found"
+                f"{Colors.RESET}"
             )
             return ExitStatus.ERROR.value
         
@@ -76,11 +109,11 @@ def main() -> int:
         return runner.print_summary()
     
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW.value}Test execution interrupted by user{Colors.RESET.value}")
+        print(f"\n{Colors.YELLOW}Test execution interrupted by user{Colors.RESET}")
         return ExitStatus.ERROR.value
     
     except Exception as e:
-        print(f"{Colors.RED.value}Error: {e}{Colors.RESET.value}")
+        print(f"{Colors.RED}Error: {e}{Colors.RESET}")
         if args.verbose if "args" in locals() else False:
             import traceback
             traceback.print_exc()
@@ -2,6 +2,7 @@
 Tests of fortest/build_system_detector.py
 Tests are ordered according to method definitions in build_system_detector.py.
 """
+import os
 from pathlib import Path
 
 import pytest
@@ -98,6 +99,41 @@ def test_detect_none(detector: BuildSystemDetector, tmp_path: Path) -> None:
     assert result is None
 
 
+def test_detect_reuses_result_for_same_directory(
+    detector: BuildSystemDetector,
+    tmp_path: Path,
+) -> None:
+    """
+    Test detecting the build system of two test files in one directory.
+    Verify that the ancestors are searched only for the first file.
+    """
+    write_file(tmp_path / "Makefile", "all:")
+    test_dir = tmp_path / "test"
+    test_dir.mkdir()
+
+    first = detector.detect(test_dir / "test_a.f90")
+    detector._list_dir_names = lambda directory: pytest.fail("directory was listed")
+    second = detector.detect(test_dir / "test_b.f90")
+
+    assert first == second == BuildSystemInfo("make", tmp_path.resolve())
+
+
+def test__list_dir_names(detector: BuildSystemDetector, tmp_path: Path) -> None:
+    """
+    Test listing directory entries with the mtime-validated cache.
+    """
+    write_file(tmp_path / "Makefile", "all:")
+    assert detector._list_dir_names(tmp_path) == {"Makefile"}
+
+    # A changed directory is listed again
+    write_file(tmp_path / "fpm.toml", "[build]")
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert detector._list_dir_names(tmp_path) == {"Makefile", "fpm.toml"}
+
+    assert detector._list_dir_names(tmp_path / "missing") == frozenset()
+
+
 def test_find_cmake_executable(detector: BuildSystemDetector, tmp_path: Path) -> None:
     """
     Test finding CMake executable.
@@ -57,6 +57,26 @@ def test_parse_test_output_empty(formatter: FortranResultFormatter) -> None:
     assert results == []
 
 
+def test_parse_test_output_with_colors_and_summary(formatter: FortranResultFormatter) -> None:
+    """
+    Test parse_test_output with colored tags, summary lines and other output.
+    Verify that only test result lines are parsed.
+    """
+    output = (
+        "\x1b[32m[PASS]\x1b[0m test_addition\n"
+        "       Expected: 5\n"
+        "\x1b[31m[FAIL]\x1b[0m test_division\n"
+        "\x1b[32m[PASS]   1\x1b[0m\n"
+        "[FAIL]   1\n"
+    )
+    results = formatter.parse_test_output(output)
+
+    assert [(r.name, r.passed) for r in results] == [
+        ("test_addition", True),
+        ("test_division", False),
+    ]
+
+
 def test_filter_fpm_output(formatter: FortranResultFormatter) -> None:
     """
     Test _filter_fpm_output.
@@ -12,6 +12,7 @@ from fortest.project_builder import ProjectBuilder
 from fortest.fortran_test_generator import FortranTestGenerator
 from fortest.fortran_test_executor import FortranTestExecutor
 from fortest.fortran_result_formatter import FortranResultFormatter
+from fortest.test_result import TestResult
 
 
 def write_file(path: Path, content: str) -> None:
@@ -77,6 +78,20 @@ def test_is_standalone_program_with_error_stop_in_name(
     assert executor.is_standalone_program(test_file) is True
 
 
+def test_is_standalone_program_with_error_stop_in_name_skips_read(
+    tmp_path: Path,
+    executor: FortranTestExecutor,
+) -> None:
+    """
+    Test is_standalone_program with error_stop in filename.
+    Verify that the file is not parsed when the name already decides.
+    """
+    test_file = tmp_path / "test_error_stop_division.f90"
+    executor._resolver.parse_fortran_file = lambda file_path: pytest.fail("file was parsed")
+
+    assert executor.is_standalone_program(test_file) is True
+
+
 def test_is_standalone_program_with_module(
     tmp_path: Path,
     executor: FortranTestExecutor,
@@ -91,6 +106,20 @@ def test_is_standalone_program_with_module(
     assert executor.is_standalone_program(test_file) is False
 
 
+def test_is_standalone_program_with_program_in_comment(
+    tmp_path: Path,
+    executor: FortranTestExecutor,
+) -> None:
+    """
+    Test is_standalone_program with 'program' only in a comment.
+    Verify that commented text does not make a module test a program.
+    """
+    test_file = tmp_path / "test_sample.f90"
+    test_file.write_text("! test program for sample\nmodule test_sample\nend module test_sample\n")
+
+    assert executor.is_standalone_program(test_file) is False
+
+
 def test_execute_and_check_error_stop_triggered(
     tmp_path: Path,
     executor: FortranTestExecutor,
@@ -181,6 +210,22 @@ exit 1
     assert exit_code == 1
 
 
+def test_map_tests_with_jobs(executor: FortranTestExecutor) -> None:
+    """
+    Test _map_tests with more than one job.
+    Verify that results keep the order of the test names.
+    """
+    executor._jobs = 4
+    test_names: list[str] = [f"test_{i}" for i in range(8)]
+
+    results = executor._map_tests(
+        lambda name: TestResult(name=name, passed=True, message=""),
+        test_names,
+    )
+
+    assert [result.name for result in results] == test_names
+
+
 def test_compile_and_run_normal_tests(
     tmp_path: Path,
     executor: FortranTestExecutor,
@@ -3,6 +3,7 @@ Tests for TestCodeGenerator class.
 Tests are ordered according to method definitions in test_code_generator.py.
 """
 
+import os
 from pathlib import Path
 
 import pytest
@@ -133,4 +134,55 @@ def test_generate_single_test_program(
     call test_addition()
 end program run_test_addition\n"""
 
-    assert text == expected
\ No newline at end of file
+    assert text == expected
+
+def test_generate_dispatching_test_program(
+    tmp_path: Path,
+    generator: FortranTestGenerator,
+) -> None:
+    """
+    Test generate_dispatching_test_program.
+    Verify that it dispatches to each test subroutine by name.
+    """
+    out = generator.generate_dispatching_test_program(
+        "test_module", ["test_addition", "test_subtraction"], tmp_path
+    )
+    text = out.read_text()
+    expected = """program fortest_dispatch
+    use fortest_assertions
+    use test_module
+    implicit none
+    character(len=63) :: fortest_test_name
+    call get_command_argument(1, fortest_test_name)
+    select case (trim(fortest_test_name))
+    case ("test_addition")
+        call test_addition()
+    case ("test_subtraction")
+        call test_subtraction()
+    case default
+        print "(2a)", "Unknown test: ", trim(fortest_test_name)
+        error stop 1
+    end select
+end program fortest_dispatch\n"""
+
+    assert out.name == "gen_dispatch_test_module.f90"
+    assert text == expected
+
+
+def test_write_program_keeps_identical_file(
+    tmp_path: Path,
+    generator: FortranTestGenerator,
+) -> None:
+    """
+    Test write_program with unchanged content.
+    Verify that an identical file is not rewritten and a changed one is.
+    """
+    generated_file = tmp_path / "gen_test_addition.f90"
+    generated_file.write_text("program a\nend program a\n")
+    os.utime(generated_file, ns=(0, 0))
+
+    generator.write_program(generated_file, "program a\nend program a\n")
+    assert generated_file.stat().st_mtime_ns == 0
+
+    generator.write_program(generated_file, "program b\nend program b\n")
+    assert generated_file.read_text() == "program b\nend program b\n"
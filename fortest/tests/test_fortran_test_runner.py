@@ -2,6 +2,9 @@
 Tests of fortest/fortran_test_runner.py
 Tests are ordered according to method definitions in fortran_test_runner.py.
 """
+import shutil
+import subprocess
+import threading
 from pathlib import Path
 
 import pytest
@@ -53,6 +56,47 @@ def test_find_test_files(tmp_path: Path, runner: FortranTestRunner) -> None:
     assert names == ["test_one.f90", "module_test_two.f90"]
 
 
+def test_find_test_files_with_pattern(
+    tmp_path: Path,
+    runner: FortranTestRunner,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests find_test_files with a file name pattern.
+    Verify that it searches the current directory tree and skips hidden directories.
+    """
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "test_a.f90").write_text("")
+    (tmp_path / "sub" / "test_b.f90").write_text("")
+    (tmp_path / "sub" / "other.f90").write_text("")
+    (tmp_path / ".hidden" / "test_c.f90").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    res = runner.find_test_files("test_*.f90")
+
+    assert res == [tmp_path / "test_a.f90", tmp_path / "sub" / "test_b.f90"]
+
+
+def test_find_test_files_with_absolute_pattern(
+    tmp_path: Path,
+    runner: FortranTestRunner,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests find_test_files with an absolute path pattern.
+    Verify that only the given location is searched.
+    """
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.f90").write_text("")
+    (tmp_path / "cwd").mkdir()
+    monkeypatch.chdir(tmp_path / "cwd")
+
+    res = runner.find_test_files(str(tmp_path / "tests" / "test_*.f90"))
+
+    assert res == [(tmp_path / "tests" / "test_a.f90").resolve()]
+
+
 def test__find_build_directories(tmp_path: Path, runner: FortranTestRunner) -> None:
     """
     Test _find_build_directories.
@@ -206,6 +250,38 @@ end module sample
         pytest.skip("gfortran not available")
 
 
+def test__compile_module_dependencies_multiple_modules(tmp_path: Path, runner: FortranTestRunner) -> None:
+    """
+    Test _compile_module_dependencies with dependent modules.
+    Verify that it returns one object per module in dependency order.
+    """
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    module_a = src_dir / "module_a.f90"
+    module_a.write_text("module mod_a\n    implicit none\n    integer :: a = 1\nend module mod_a\n")
+    module_b = src_dir / "module_b.f90"
+    module_b.write_text("module mod_b\n    use mod_a\n    implicit none\nend module mod_b\n")
+
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+    test_file = tmp_path / "test" / "test_sample.f90"
+    test_file.parent.mkdir()
+    test_file.touch()
+
+    try:
+        objects, error = runner._compile_module_dependencies(
+            [module_a, module_b],
+            test_file,
+            output_dir,
+        )
+    except Exception:
+        pytest.skip("gfortran not available")
+
+    if error is None:
+        assert objects == [output_dir / "module_a.o", output_dir / "module_b.o"]
+        assert all(obj.exists() for obj in objects)
+
+
 def test__compile_single_module_creates_object(tmp_path: Path, runner: FortranTestRunner) -> None:
     """
     Test _compile_single_module.
@@ -364,4 +440,86 @@ def test__generate_temp_test_filename(tmp_path: Path, runner: FortranTestRunner)
     temp_file4, program_name4 = runner._generate_temp_test_filename("test_addition", test_dir)
     assert temp_file4 != temp_file1  # Should get a different name due to collision
     assert program_name4 != program_name1  # Program name should also differ
-    assert "_1" in temp_file4.name or "_1" in program_name4  # Counter added
\ No newline at end of file
+    assert "_1" in temp_file4.name or "_1" in program_name4  # Counter added
+
+
+def test_run_tests_verbose_is_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test run_tests in verbose mode with more than one job.
+    Verify that test files are run one after another, not in parallel.
+    """
+    runner = FortranTestRunner(verbose=True, jobs=4)
+    test_files = [tmp_path / "test_a.f90", tmp_path / "test_b.f90"]
+    handled: list[Path] = []
+
+    def handle_test_file(test_file: Path, output_dir: Path) -> tuple[list, list]:
+        handled.append(test_file)
+        return [], []
+
+    monkeypatch.setattr(runner, "_run_test_files_parallel", lambda *args: pytest.fail("ran in parallel"))
+    monkeypatch.setattr(runner.executor, "handle_test_file", handle_test_file)
+    monkeypatch.setattr(runner.resolver, "save_module_name_cache", lambda: None)
+
+    runner.run_tests(test_files)
+
+    assert handled == test_files
+
+
+def test__run_test_files_parallel_bounds_processes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test _run_test_files_parallel with nested pools.
+    Verify that no more than jobs child processes run at once.
+    Note: This requires gfortran to be available.
+    """
+    if shutil.which("gfortran") is None:
+        pytest.skip("gfortran not available")
+
+    lock = threading.Lock()
+    running: list[int] = [0, 0]  # current, peak
+
+    class CountingPopen(subprocess.Popen):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+
+        def __exit__(self, *args) -> None:
+            super().__exit__(*args)
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(subprocess, "Popen", CountingPopen)
+
+    test_files: list[Path] = []
+    for i in range(4):
+        test_file = tmp_path / f"test_sample{i}.f90"
+        write_file(test_file, f"""
+module test_sample{i}
+    use fortest_assertions
+    implicit none
+contains
+    subroutine test_one()
+        call assert_true(.true., "test_one")
+    end subroutine test_one
+    subroutine test_two()
+        call assert_true(.true., "test_two")
+    end subroutine test_two
+    subroutine test_three()
+        call assert_true(.true., "test_three")
+    end subroutine test_three
+end module test_sample{i}
+""")
+        test_files.append(test_file)
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+
+    runner = FortranTestRunner(verbose=False, jobs=2)
+    runner._run_test_files_parallel(test_files, output_dir)
+
+    assert runner.total_tests == 12
+    assert 0 < running[1] <= 2
+
@@ -3,11 +3,12 @@ Tests for ModuleDependencyResolver class.
 Tests are ordered according to method definitions in module_dependency_resolver.py.
 """
 
+import os
 from pathlib import Path
 
 import pytest
 
-from fortest.module_dependency_resolver import ModuleDependencyResolver
+from fortest.module_dependency_resolver import FortranFileInfo, ModuleDependencyResolver
 
 
 def write_file(path: Path, content: str) -> None:
@@ -25,6 +26,25 @@ def resolver() -> ModuleDependencyResolver:
     return ModuleDependencyResolver(verbose=False)
 
 
+def test_clear_caches(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test clear_caches.
+    Verify that directory listings are reused until the caches are cleared.
+    """
+    write_file(tmp_path / "mod1.f90", "module mod1\nend module mod1\n")
+    assert [f.name for f in resolver.find_fortran_files_recursive(tmp_path)] == ["mod1.f90"]
+
+    write_file(tmp_path / "mod2.f90", "module mod2\nend module mod2\n")
+    assert [f.name for f in resolver.find_fortran_files_recursive(tmp_path)] == ["mod1.f90"]
+
+    resolver.clear_caches()
+    names = sorted(f.name for f in resolver.find_fortran_files_recursive(tmp_path))
+    assert names == ["mod1.f90", "mod2.f90"]
+
+
 def test_find_module_files_finds_assertions_and_user_modules(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -62,6 +82,64 @@ end module test_module_sample
     assert found_names == ["module_fortest_assertions.f90", "module_sample.f90"]
 
 
+def test_find_module_files_reuses_result(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test find_module_files called twice for the same test file.
+    Verify that dependencies are resolved once until the test file changes.
+    """
+    (tmp_path / "src").mkdir()
+    write_file(tmp_path / "src" / "mod_a.f90", "module mod_a\nend module mod_a\n")
+    write_file(tmp_path / "src" / "mod_b.f90", "module mod_b\nend module mod_b\n")
+    test_file = tmp_path / "test_a.f90"
+    write_file(test_file, "module test_a\n    use mod_a\nend module test_a\n")
+    assert resolver.find_module_files(test_file) == [tmp_path / "src" / "mod_a.f90"]
+
+    calls: list[list[str]] = []
+    find_user_modules_recursive = resolver._find_user_modules_recursive
+    def record(used_modules, *args) -> None:
+        calls.append(used_modules)
+        find_user_modules_recursive(used_modules, *args)
+    resolver._find_user_modules_recursive = record
+    assert resolver.find_module_files(test_file) == [tmp_path / "src" / "mod_a.f90"]
+    assert calls == []
+
+    write_file(test_file, "module test_a\n    use mod_b\nend module test_a\n")
+    st = test_file.stat()
+    os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert resolver.find_module_files(test_file) == [tmp_path / "src" / "mod_b.f90"]
+    assert calls == [["mod_b"]]
+
+
+def test_resolve_all_dependencies(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test resolve_all_dependencies.
+    Verify that it matches find_module_files for every test file.
+    """
+    (tmp_path / "src").mkdir()
+    (tmp_path / "test").mkdir()
+    write_file(tmp_path / "src" / "mod_a.f90", "module mod_a\nend module mod_a\n")
+    write_file(tmp_path / "src" / "mod_b.f90", "module mod_b\n    use mod_a\nend module mod_b\n")
+    test_files = []
+    for name, used in [("test_a", "mod_a"), ("test_b", "mod_b"), ("test_none", "iso_fortran_env")]:
+        test_file = tmp_path / "test" / f"{name}.f90"
+        write_file(test_file, f"module {name}\n    use {used}\nend module {name}\n")
+        test_files.append(test_file)
+
+    result = resolver.resolve_all_dependencies(test_files, include_assertions=False)
+
+    assert list(result) == test_files
+    assert result[test_files[0]] == [tmp_path / "src" / "mod_a.f90"]
+    assert result[test_files[1]] == [tmp_path / "src" / "mod_a.f90", tmp_path / "src" / "mod_b.f90"]
+    assert result[test_files[2]] == []
+    assert resolver.resolve_all_dependencies([]) == {}
+
+
 def test_extract_use_statements(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -124,6 +202,30 @@ end module sample
     assert "module_b" not in uses
 
 
+def test_extract_use_statements_ignores_identifiers_starting_with_use(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test extract_use_statements with variables whose names start with 'use'.
+    Verify that only real use statements are extracted.
+    """
+    f = tmp_path / "sample.f90"
+    content = """
+module sample
+    use, non_intrinsic :: module_a
+    integer :: user_count
+contains
+    subroutine run()
+        user_count = 1
+        useful = 2
+    end subroutine run
+end module sample
+"""
+    write_file(f, content)
+    assert resolver.extract_use_statements(f) == ["module_a"]
+
+
 def test_extract_module_name(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -152,6 +254,201 @@ def test_extract_module_name_no_module(
     assert name is None
 
 
+def test_extract_module_name_reparses_changed_file(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test extract_module_name with a file modified after the first call.
+    Verify that the cached name is not returned for a changed file.
+    """
+    f = tmp_path / "module_a.f90"
+    write_file(f, "module mod_a\nend module mod_a\n")
+    assert resolver.extract_module_name(f) == "mod_a"
+
+    write_file(f, "module mod_renamed\nend module mod_renamed\n")
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert resolver.extract_module_name(f) == "mod_renamed"
+
+
+def test_save_module_name_cache(
+    tmp_path: Path,
+) -> None:
+    """
+    Test save_module_name_cache.
+    Verify that a new resolver reuses the index without reading unchanged files.
+    """
+    cache_dir = tmp_path / "cache"
+    f = tmp_path / "module_a.f90"
+    write_file(f, "module mod_a\nend module mod_a\n")
+
+    first = ModuleDependencyResolver(verbose=False, cache_dir=cache_dir)
+    assert first.extract_module_name(f) == "mod_a"
+    first.save_module_name_cache()
+    assert len(list(cache_dir.glob("module_index_*.json"))) == 1
+
+    second = ModuleDependencyResolver(verbose=False, cache_dir=cache_dir)
+    second.parse_fortran_file = lambda file_path: pytest.fail("unchanged file was parsed")
+    assert second.extract_module_name(f) == "mod_a"
+
+
+def test_classify_test_file(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test classify_test_file.
+    Verify that it distinguishes programs from modules and ignores comments.
+    """
+    program = tmp_path / "test_program.f90"
+    write_file(program, "! module in a comment\nprogram My_Program\nend program My_Program\n")
+    module = tmp_path / "test_module.f90"
+    write_file(module, "! program in a comment\nmodule Test_Module\nend module Test_Module\n")
+    empty = tmp_path / "test_empty.f90"
+    write_file(empty, "! nothing here\n")
+
+    assert resolver.classify_test_file(program) == ("program", "my_program")
+    assert resolver.classify_test_file(module) == ("module", "test_module")
+    assert resolver.classify_test_file(empty) == ("module", None)
+
+
+def test_parse_fortran_file(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test parse_fortran_file.
+    Verify that all facts are extracted from one read and comments are ignored.
+    """
+    f = tmp_path / "test_sample.f90"
+    content = """
+! use module_commented
+module Test_Sample
+    use module_a
+    use, intrinsic :: iso_fortran_env
+    use module_a, only: func
+contains
+    subroutine test_First()
+    end subroutine test_First
+    ! subroutine test_commented()
+    subroutine helper()
+    end subroutine helper
+    subroutine test_second()
+    end subroutine test_second
+end module Test_Sample
+
+module helpers
+    interface swap
+        module procedure swap_int
+    end interface swap
+end module helpers
+"""
+    write_file(f, content)
+
+    assert resolver.parse_fortran_file(f) == FortranFileInfo(
+        module_name="test_sample",
+        program_name=None,
+        used_modules=("module_a", "iso_fortran_env"),
+        test_subroutines=("test_first", "test_second"),
+        module_names=("test_sample", "helpers"),
+    )
+    assert resolver.parse_fortran_file(tmp_path / "missing.f90") == FortranFileInfo()
+
+
+def test_parse_fortran_file_keywords_inside_lines(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test parse_fortran_file with keywords in the middle of a line.
+    Verify that only statements at the start of a line are extracted.
+    """
+    f = tmp_path / "test_sample.f90"
+    content = """
+module test_sample
+    use module_a ! use module_b
+contains
+    subroutine test_first()
+        print *, "this module handles program input"
+    end subroutine test_first
+endmodule test_sample
+"""
+    write_file(f, content)
+
+    assert resolver.parse_fortran_file(f) == FortranFileInfo(
+        module_name="test_sample",
+        program_name=None,
+        used_modules=("module_a",),
+        test_subroutines=("test_first",),
+        module_names=("test_sample",),
+    )
+
+
+def test_parse_fortran_file_bare_end_before_program(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test parse_fortran_file with a bare 'end module' followed by a program.
+    Verify that the program keyword is not taken as a module name.
+    """
+    f = tmp_path / "test_prog.f90"
+    content = """
+module helper
+contains
+    subroutine check()
+    end subroutine check
+end module
+program test_prog
+    use helper
+end program test_prog
+"""
+    write_file(f, content)
+
+    info = resolver.parse_fortran_file(f)
+
+    assert info.program_name == "test_prog"
+    assert info.module_names == ("helper",)
+    assert resolver.classify_test_file(f) == ("program", "test_prog")
+
+
+def test_parse_fortran_file_bare_end_modules(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test parse_fortran_file with two modules ending in a bare 'end module'.
+    Verify that end statements add no module names.
+    """
+    f = tmp_path / "modules.f90"
+    write_file(f, "module first\nend module\nmodule second\nend module\n")
+
+    info = resolver.parse_fortran_file(f)
+
+    assert info.module_name == "first"
+    assert info.module_names == ("first", "second")
+
+
+def test_parse_fortran_file_large_source(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test parse_fortran_file with a source above the mmap threshold.
+    Verify that the mapped file is parsed like a read one.
+    """
+    f = tmp_path / "module_large.f90"
+    padding = "    ! padding comment line\n" * 4000
+    write_file(f, f"module large\n    use module_a\n{padding}end module large\n")
+    assert f.stat().st_size >= resolver.MMAP_SIZE_MIN
+
+    info = resolver.parse_fortran_file(f)
+
+    assert info.module_name == "large"
+    assert info.used_modules == ("module_a",)
+
+
 def test_find_fortran_files_recursive(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -179,6 +476,24 @@ def test_find_fortran_files_recursive(
     assert names == ["mod1.f90", "mod2.f90", "mod3.f90"]
 
 
+def test_find_fortran_files_recursive_skips_noisy_directories(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test find_fortran_files_recursive with well-known noisy directories.
+    Verify that build trees, VCS and tool directories are not scanned.
+    """
+    for name in ["build", "node_modules", ".git", "__pycache__"]:
+        (tmp_path / "src" / name).mkdir(parents=True)
+        (tmp_path / "src" / name / "generated.f90").write_text("! generated")
+    (tmp_path / "src" / "mod1.f90").write_text("! mod1")
+
+    files = resolver.find_fortran_files_recursive(tmp_path / "src")
+
+    assert [f.name for f in files] == ["mod1.f90"]
+
+
 def test_find_module_file_by_name(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -252,6 +567,125 @@ def test_find_module_file_by_name_in_subdirectories(
     assert "io" in str(found3)
 
 
+def test_lookup_module_by_file_name(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test _lookup_module with conventionally named files.
+    Verify that a file name hit is returned without indexing every file.
+    """
+    write_file(tmp_path / "module_mod_a.f90", "module mod_a\nend module mod_a\n")
+    write_file(tmp_path / "other.f90", "module mod_b\nend module mod_b\n")
+
+    assert resolver._lookup_module("mod_a", [tmp_path]) == tmp_path / "module_mod_a.f90"
+    assert resolver._module_index_cache == {}
+
+    # A module in an oddly named file is still found through the index
+    assert resolver._lookup_module("mod_b", [tmp_path]) == tmp_path / "other.f90"
+    assert len(resolver._module_index_cache) == 1
+
+
+def test_lookup_module_defined_in_two_directories(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test _lookup_module with a module defined in two search directories.
+    Verify that the first directory wins whether or not it was indexed already.
+    """
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    write_file(tmp_path / "first" / "other.f90", "module foo\nend module foo\n")
+    write_file(tmp_path / "first" / "bar.f90", "module foo\nend module foo\n")
+    write_file(tmp_path / "first" / "foo_impl.f90", "module foo\nend module foo\n")
+    write_file(tmp_path / "second" / "foo.f90", "module foo\nend module foo\n")
+    search_dirs = [tmp_path / "first", tmp_path / "second"]
+    expected = tmp_path / "first" / "foo_impl.f90"
+
+    assert resolver._lookup_module("foo", search_dirs) == expected
+    assert resolver._lookup_module("foo", [tmp_path / "second"]) == tmp_path / "second" / "foo.f90"
+
+    resolver._build_module_index(search_dirs)
+    assert resolver._lookup_module("foo", search_dirs) == expected
+
+    # Without a conventionally named file, the first directory still wins
+    (tmp_path / "first" / "foo_impl.f90").unlink()
+    fresh = ModuleDependencyResolver(verbose=False)
+    found = fresh._lookup_module("foo", search_dirs)
+    assert found is not None and found.parent == tmp_path / "first"
+    fresh._build_module_index(search_dirs)
+    assert fresh._lookup_module("foo", search_dirs) == found
+
+
+def test_build_module_index(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test _build_module_index.
+    Verify that the first search directory wins and the index is built once.
+    """
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    write_file(tmp_path / "first" / "mod_a.f90", "module mod_a\nend module mod_a\n")
+    write_file(tmp_path / "second" / "mod_a.f90", "module mod_a\nend module mod_a\n")
+    write_file(tmp_path / "second" / "mod_b.f90", "module Mod_B\nend module Mod_B\n")
+    search_dirs = [tmp_path / "first", tmp_path / "second"]
+
+    index = resolver._build_module_index(search_dirs)
+
+    assert index == {
+        "mod_a": tmp_path / "first" / "mod_a.f90",
+        "mod_b": tmp_path / "second" / "mod_b.f90",
+    }
+    assert resolver._build_module_index(search_dirs) is index
+
+
+def test_find_build_directories(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test find_build_directories.
+    Verify that it finds build/ and its subdirectories containing .mod files.
+    """
+    build_dir = tmp_path / "build"
+    (build_dir / "mods").mkdir(parents=True)
+    (build_dir / "mods" / "module1.mod").write_text("")
+    (build_dir / "objs").mkdir()
+    (build_dir / "objs" / "module1.o").write_text("")
+
+    test_file = tmp_path / "test" / "test_sample.f90"
+    test_file.parent.mkdir()
+    test_file.write_text("")
+
+    build_dirs = resolver.find_build_directories(test_file)
+
+    assert build_dirs[0] == build_dir
+    assert build_dir / "mods" in build_dirs
+    assert build_dir / "objs" not in build_dirs
+
+
+def test_find_build_directories_is_cached(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test find_build_directories caching.
+    Verify that tests in the same directory reuse the first result.
+    """
+    test_dir = tmp_path / "test"
+    test_dir.mkdir()
+    first = resolver.find_build_directories(test_dir / "test_one.f90")
+
+    # A build directory created afterwards is not picked up from the cache
+    (tmp_path / "build").mkdir()
+    second = resolver.find_build_directories(test_dir / "test_two.f90")
+
+    assert first == second == []
+
+
 def test_find_assertion_module(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
@@ -276,12 +710,32 @@ def test_find_assertion_module(
     assert found == assertions_file
 
 
+def test_find_assertion_module_in_nested_directory(
+    tmp_path: Path,
+    resolver: ModuleDependencyResolver,
+) -> None:
+    """
+    Test _find_assertion_module when the file is not at a probed location.
+    Verify that it falls back to scanning the search directories.
+    """
+    nested_dir = tmp_path / "third_party" / "fortest"
+    nested_dir.mkdir(parents=True)
+    assertions_file = nested_dir / "module_fortest_assertions.f90"
+    assertions_file.write_text(
+        "module fortest_assertions\nend module fortest_assertions\n"
+    )
+
+    found = resolver._find_assertion_module([tmp_path])
+
+    assert found == assertions_file
+
+
 def test_find_user_modules(
     tmp_path: Path,
     resolver: ModuleDependencyResolver,
 ) -> None:
     """
-    Test _find_user_modules.
+    Test find_user_modules.
     Verify that it finds user modules while skipping intrinsic and assertion modules.
     """
     # Create directory structure
@@ -310,7 +764,7 @@ def test_find_user_modules(
     ]
 
     search_dirs = [src_dir]
-    found_modules = resolver._find_user_modules(used_modules, search_dirs, test_file)
+    found_modules = resolver.find_user_modules(used_modules, search_dirs, test_file)
 
     # Should find only user modules
     found_names = {f.stem for f in found_modules}
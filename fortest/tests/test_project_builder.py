@@ -4,4 +4,91 @@
 # that require a working Fortran compiler and build environment.
 # Therefore, most tests are integration tests rather than unit tests.
 # The integration tests are performed through the FortranTestRunner
-# in test_fortran_test_runner.py and through the examples directory.
\ No newline at end of file
+# in test_fortran_test_runner.py and through the examples directory.
+
+from pathlib import Path
+
+from fortest.project_builder import ProjectBuilder
+
+
+def test__compile_levels(tmp_path: Path) -> None:
+    """
+    Test _compile_levels.
+    Verify that independent modules share a level and users come after them.
+    """
+    mod_a = tmp_path / "mod_a.f90"
+    mod_b = tmp_path / "mod_b.f90"
+    mod_c = tmp_path / "mod_c.f90"
+    mod_a.write_text("module mod_a\nend module mod_a\n")
+    mod_b.write_text("module mod_b\n    use iso_fortran_env\nend module mod_b\n")
+    mod_c.write_text("module mod_c\n    use mod_a\n    use mod_b\nend module mod_c\n")
+
+    levels = ProjectBuilder()._compile_levels([mod_a, mod_b, mod_c])
+
+    assert levels == [[mod_a, mod_b], [mod_c]]
+
+
+def test__compile_levels_bare_end_module(tmp_path: Path) -> None:
+    """
+    Test _compile_levels with several modules in a file ending in a bare 'end module'.
+    Verify that every module of the file is placed on the file's level.
+    """
+    shapes = tmp_path / "shapes.f90"
+    mod_c = tmp_path / "mod_c.f90"
+    mod_d = tmp_path / "mod_d.f90"
+    shapes.write_text("module mod_a\nend module\nmodule mod_b\n    use mod_a\nend module\n")
+    mod_c.write_text("module mod_c\nend module\n")
+    mod_d.write_text("module mod_d\n    use mod_b\nend module\n")
+
+    levels = ProjectBuilder()._compile_levels([shapes, mod_c, mod_d])
+
+    assert levels == [[shapes, mod_c], [mod_d]]
+
+
+def test__object_cache_keys(tmp_path: Path) -> None:
+    """
+    Test _object_cache_keys.
+    Verify that a changed module also changes the keys of the sources using it.
+    """
+    mod_a = tmp_path / "mod_a.f90"
+    mod_b = tmp_path / "mod_b.f90"
+    program = tmp_path / "main.f90"
+    mod_a.write_text("module mod_a\nend module mod_a\n")
+    mod_b.write_text("module mod_b\n    use mod_a\nend module mod_b\n")
+    program.write_text("program main\n    use mod_b\nend program main\n")
+    sources = [mod_a, mod_b, program]
+
+    assert ProjectBuilder()._object_cache_keys(sources) == [None, None, None]
+
+    key_a, key_b, key_program = ProjectBuilder(cache_dir=tmp_path / "cache")._object_cache_keys(sources)
+    assert key_a is not None and key_b is not None and key_a != key_b
+    assert key_program is None
+
+    mod_a.write_text("module mod_a\n    integer :: x\nend module mod_a\n")
+    new_key_a, new_key_b, _ = ProjectBuilder(cache_dir=tmp_path / "cache")._object_cache_keys(sources)
+    assert new_key_a != key_a
+    assert new_key_b != key_b
+
+
+def test__store_cached_object_missing_module_file(tmp_path: Path) -> None:
+    """
+    Test _store_cached_object when a module file of the source is missing.
+    Verify that no entry is stored, and that a complete one is restored.
+    """
+    source = tmp_path / "shapes.f90"
+    source.write_text("module mod_a\nend module\nmodule mod_b\nend module\n")
+    obj = tmp_path / "shapes.o"
+    obj.write_bytes(b"object")
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    (module_dir / "mod_a.mod").write_bytes(b"a")
+    builder = ProjectBuilder(cache_dir=tmp_path / "cache")
+
+    builder._store_cached_object("ab12", source, obj, module_dir)
+    assert not builder._restore_cached_object("ab12", tmp_path / "restored.o", tmp_path)
+
+    (module_dir / "mod_b.mod").write_bytes(b"b")
+    builder._store_cached_object("ab12", source, obj, module_dir)
+    assert builder._restore_cached_object("ab12", tmp_path / "restored.o", tmp_path)
+    assert (tmp_path / "mod_b.mod").read_bytes() == b"b"
+
@@ -3,6 +3,10 @@ Tests of fortest/utilities.py
 Tests are ordered according to method definitions in runner.py.
 """
 
+import io
+import threading
+from pathlib import Path
+
 import pytest
 
 import fortest.utilities as utils
@@ -17,4 +21,64 @@ def test_deduplicate():
     correct: list[str] = ["a", "b", "c", "z", "d"]
     expected: list[str] = utils.deduplicate(test_list)
 
-    assert expected == correct
\ No newline at end of file
+    assert expected == correct
+
+
+def test_deduplicate_unhashable():
+    """
+    Tests deduplicate with unhashable elements.
+    Verify that it deduplicates by equality, also from an iterator.
+    """
+    test_list: list[list[int]] = [[1], [2], [1], [3], [2]]
+    correct: list[list[int]] = [[1], [2], [3]]
+
+    assert utils.deduplicate(test_list) == correct
+    assert utils.deduplicate(iter(test_list)) == correct
+
+
+def test_is_existing_dir(tmp_path: Path):
+    """
+    Tests is_existing_dir.
+    Verify that it is True only for existing directories.
+    """
+    file_path: Path = tmp_path / "file.txt"
+    file_path.write_text("")
+
+    assert utils.is_existing_dir(tmp_path) is True
+    assert utils.is_existing_dir(str(tmp_path)) is True
+    assert utils.is_existing_dir(file_path) is False
+    assert utils.is_existing_dir(tmp_path / "missing") is False
+
+
+def test_available_cpu_count(monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests available_cpu_count.
+    Verify that the affinity mask takes precedence over the CPU count.
+    """
+    monkeypatch.setattr(utils.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 64)
+
+    assert utils.available_cpu_count() == 2
+
+
+def test_route_thread_output(capsys: pytest.CaptureFixture[str]):
+    """
+    Tests route_thread_output with set_thread_output.
+    Verify that a thread with a buffer writes to it and others write to stdout.
+    """
+    buffer: io.StringIO = io.StringIO()
+
+    def worker() -> None:
+        utils.set_thread_output(buffer)
+        assert utils.get_thread_output() is buffer
+        print("buffered")
+        utils.set_thread_output(None)
+
+    with utils.route_thread_output():
+        thread: threading.Thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        print("direct")
+
+    assert buffer.getvalue() == "buffered\n"
+    assert capsys.readouterr().out == "direct\n"